@@ -0,0 +1,42 @@
+"""
+Browser Options - Chromium launch settings shared by the scraper, the form
+filler and the browser server.
+
+Kept free of Playwright and Rich imports so importing it costs nothing.
+"""
+
+from pathlib import Path
+from typing import Any, Optional
+
+# Chromium flags that cut CPU/memory use for automation runs
+BROWSER_ARGS = [
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--mute-audio",
+    "--disable-backgrounding-occluded-windows",
+    "--no-zygote",
+]
+
+DEFAULT_SLOW_MO = 100
+DEFAULT_OUTPUT_DIR = Path("./output")
+
+
+def browser_launch_options(
+    headless: bool,
+    slow_mo: int = DEFAULT_SLOW_MO,
+    downloads_path: Optional[Path] = None
+) -> dict[str, Any]:
+    """
+    Keyword arguments for chromium.launch(), shared by `fill` and the browser server.
+    
+    Args:
+        headless: Run browser in headless mode
+        slow_mo: Slow down operations by this many milliseconds
+        downloads_path: Directory for browser downloads (default: ./output)
+    """
+    return {
+        "headless": headless,
+        "slow_mo": slow_mo,
+        "downloads_path": str(downloads_path or DEFAULT_OUTPUT_DIR),
+        "args": BROWSER_ARGS,
+    }
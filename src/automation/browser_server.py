@@ -0,0 +1,213 @@
+"""
+Browser Server - Keeps a Playwright browser running between form fills.
+
+`videx serve` launches Chromium once and listens on a Unix socket. When
+VIDEX_BROWSER_SOCK points at that socket, `videx fill` sends its job to the
+server instead of cold-starting a browser on every run.
+
+Protocol: one JSON object per line in each direction.
+    request:  {"data_path": ..., "schema_path": ..., "defaults_path": ...,
+               "output_dir": ..., "submit": bool, "save_pdf": bool}
+    response: {"ok": true, "result": {...}} or {"ok": false, "error": "..."}
+"""
+
+import json
+import os
+import socket
+import stat
+from pathlib import Path
+from typing import Any, Optional
+from rich.console import Console
+
+console = Console()
+
+SOCKET_ENV_VAR = "VIDEX_BROWSER_SOCK"
+# The per-user runtime directory is private; /tmp is a shared, predictable location
+DEFAULT_SOCKET_PATH = Path(os.environ.get("XDG_RUNTIME_DIR") or "/tmp") / "videx-browser.sock"
+
+
+class BrowserServerError(Exception):
+    """Raised when the browser server cannot run a fill job."""
+    pass
+
+
+def _optional_path(value: Optional[str]) -> Optional[Path]:
+    """Convert an optional path string from a request to a Path."""
+    return Path(value) if value else None
+
+
+def _run_fill_job(browser, request: dict[str, Any]) -> dict[str, Any]:
+    """Run a single fill job on the shared browser."""
+    from .form_filler import fill_videx_form
+    
+    results = fill_videx_form(
+        data_path=Path(request["data_path"]),
+        schema_path=_optional_path(request.get("schema_path")),
+        defaults_path=_optional_path(request.get("defaults_path")),
+        headless=True,  # Browser is already launched; skips the close delay
+        submit=request.get("submit", False),
+        save_pdf=request.get("save_pdf", True),
+        output_dir=_optional_path(request.get("output_dir")),
+        browser=browser
+    )
+    
+    pdf_path = results.get("pdf_path")
+    results["pdf_path"] = str(pdf_path) if pdf_path else None
+    return results
+
+
+def _claim_socket(socket_path: Path) -> None:
+    """
+    Remove a stale socket file left behind by a server that is gone.
+    
+    Raises:
+        BrowserServerError: If the path is not a socket, or another server is
+            still listening on it
+    """
+    try:
+        mode = socket_path.lstat().st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise BrowserServerError(f"{socket_path} exists and is not a socket")
+    
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(str(socket_path))
+    except FileNotFoundError:
+        return
+    except ConnectionRefusedError:
+        socket_path.unlink()
+        return
+    finally:
+        probe.close()
+    
+    raise BrowserServerError(f"A browser server is already listening on {socket_path}")
+
+
+def serve(
+    socket_path: Path = DEFAULT_SOCKET_PATH,
+    headless: bool = True,
+    idle_timeout: float = 600.0,
+    max_jobs: int = 50
+) -> None:
+    """
+    Serve fill jobs from a single long-lived browser.
+    
+    Each job gets a fresh browser context so no cookies or form state leak
+    between applicants. The browser is relaunched after `max_jobs` jobs to
+    bound Chromium's memory growth, or before the next job if it has crashed.
+    The server exits after `idle_timeout` seconds without a request.
+    
+    Args:
+        socket_path: Unix socket to listen on
+        headless: Run browser in headless mode
+        idle_timeout: Seconds without a request before shutting down
+        max_jobs: Number of jobs after which the browser is relaunched
+    
+    Raises:
+        BrowserServerError: If the socket path is taken by another server or
+            by a file that is not a socket
+    """
+    from playwright.sync_api import sync_playwright
+    from .browser_options import browser_launch_options
+    
+    _claim_socket(socket_path)
+    launch_options = browser_launch_options(headless)
+    
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(socket_path))
+    server.listen()
+    server.settimeout(idle_timeout)
+    
+    with sync_playwright() as p:
+        browser = p.chromium.launch(**launch_options)
+        jobs = 0
+        console.print(f"[green]Browser server listening on {socket_path}[/green]")
+        console.print(f"[cyan]Use it with: export {SOCKET_ENV_VAR}={socket_path}[/cyan]")
+        
+        try:
+            while True:
+                try:
+                    conn, _ = server.accept()
+                except socket.timeout:
+                    console.print(f"[cyan]Idle for {idle_timeout:.0f}s, shutting down.[/cyan]")
+                    break
+                
+                with conn:
+                    conn.settimeout(None)
+                    try:
+                        line = conn.makefile("rb").readline()
+                        if not line:
+                            continue  # Liveness probe from another `serve`
+                        
+                        request = json.loads(line)
+                        
+                        if not browser.is_connected():
+                            console.print("[yellow]Browser disconnected, relaunching...[/yellow]")
+                            browser = p.chromium.launch(**launch_options)
+                            jobs = 0
+                        elif jobs >= max_jobs:
+                            console.print("[cyan]Recycling browser...[/cyan]")
+                            browser.close()
+                            browser = p.chromium.launch(**launch_options)
+                            jobs = 0
+                        
+                        jobs += 1
+                        response = {"ok": True, "result": _run_fill_job(browser, request)}
+                    except Exception as e:
+                        console.print(f"[red]Fill job failed: {e}[/red]")
+                        response = {"ok": False, "error": str(e)}
+                    
+                    conn.sendall(json.dumps(response).encode("utf-8") + b"\n")
+        except KeyboardInterrupt:
+            console.print("[cyan]Browser server stopped.[/cyan]")
+        finally:
+            browser.close()
+            server.close()
+            socket_path.unlink(missing_ok=True)
+
+
+def submit_fill_job(
+    socket_path: Path,
+    data_path: Path,
+    schema_path: Optional[Path] = None,
+    defaults_path: Optional[Path] = None,
+    submit: bool = False,
+    save_pdf: bool = True,
+    output_dir: Optional[Path] = None
+) -> dict[str, Any]:
+    """
+    Send a fill job to a running browser server and wait for the result.
+    
+    Returns:
+        The same result dictionary as fill_videx_form
+    
+    Raises:
+        BrowserServerError: If the server is unreachable or the job failed
+    """
+    request = {
+        "data_path": str(data_path.resolve()),
+        "schema_path": str(schema_path.resolve()) if schema_path else None,
+        "defaults_path": str(defaults_path.resolve()) if defaults_path else None,
+        "output_dir": str(output_dir.resolve()) if output_dir else None,
+        "submit": submit,
+        "save_pdf": save_pdf,
+    }
+    
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            conn.connect(str(socket_path))
+            conn.sendall(json.dumps(request).encode("utf-8") + b"\n")
+            line = conn.makefile("rb").readline()
+    except OSError as e:
+        raise BrowserServerError(f"Could not reach browser server at {socket_path}: {e}")
+    
+    if not line:
+        raise BrowserServerError("Browser server closed the connection without a response")
+    
+    response = json.loads(line)
+    if not response.get("ok"):
+        raise BrowserServerError(response.get("error", "Unknown browser server error"))
+    
+    return response["result"]
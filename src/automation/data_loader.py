@@ -2,14 +2,20 @@
 Data Loader - Loads and validates applicant data from JSON files.
 """
 
-import json
 from pathlib import Path
 from typing import Any, Optional
 from rich.console import Console
 from rich.table import Table
 
+from .json_io import load_json
+
 console = Console()
 
+# schema path -> (mtime_ns, required field IDs), so long-running processes
+# (API, browser server) don't re-parse an unchanged schema on every validation.
+# Only the latest version of each schema is kept.
+_REQUIRED_FIELDS_CACHE: dict[str, tuple[int, list[str]]] = {}
+
 
 class DataValidationError(Exception):
     """Raised when applicant data validation fails."""
@@ -28,13 +34,12 @@ def load_applicant_data(data_path: Path) -> dict[str, Any]:
     
     Raises:
         FileNotFoundError: If the file doesn't exist
-        json.JSONDecodeError: If the file is not valid JSON
+        ValueError: If the file is not valid JSON
     """
-    if not data_path.exists():
-        raise FileNotFoundError(f"Applicant data file not found: {data_path}")
-    
-    with open(data_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    try:
+        data = load_json(data_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Applicant data file not found: {data_path}") from None
     
     console.print(f"[green]Loaded applicant data from {data_path}[/green]")
     return data
@@ -108,37 +113,51 @@ def validate_required_fields(
 
 def _get_required_fields_from_schema(schema_path: Path) -> list[str]:
     """Extract required field IDs from the schema file."""
-    if not schema_path.exists():
+    try:
+        mtime = schema_path.stat().st_mtime_ns
+    except FileNotFoundError:
         return []
     
-    with open(schema_path, 'r', encoding='utf-8') as f:
-        schema = json.load(f)
-    
-    required = []
-    for page in schema.get("form_pages", []):
-        for field in page.get("fields", []):
-            if field.get("required", False):
-                required.append(field.get("id"))
+    cache_key = str(schema_path)
+    cached = _REQUIRED_FIELDS_CACHE.get(cache_key)
+    if cached is not None and cached[0] == mtime:
+        required = cached[1]
+    else:
+        schema = load_json(schema_path)
+        
+        required = []
+        for page in schema.get("form_pages", []):
+            for field in page.get("fields", []):
+                if field.get("required", False):
+                    required.append(field.get("id"))
+        
+        _REQUIRED_FIELDS_CACHE[cache_key] = (mtime, required)
     
-    return required
+    return list(required)
 
 
-def display_data_summary(data: dict[str, Any], schema_path: Optional[Path] = None) -> None:
+def display_data_summary(data: dict[str, Any], schema_path: Optional[Path] = None) -> tuple[int, int]:
     """
     Display a summary of the applicant data.
     
     Args:
         data: Flat applicant data dictionary
         schema_path: Optional path to schema for field labels
+    
+    Returns:
+        Tuple of (filled count, empty count)
     """
     # Load labels from schema if available
     labels = {}
-    if schema_path and schema_path.exists():
-        with open(schema_path, 'r', encoding='utf-8') as f:
-            schema = json.load(f)
-        for page in schema.get("form_pages", []):
-            for field in page.get("fields", []):
-                labels[field.get("id")] = field.get("label", field.get("id"))
+    schema = {}
+    if schema_path:
+        try:
+            schema = load_json(schema_path)
+        except FileNotFoundError:
+            pass
+    for page in schema.get("form_pages", []):
+        for field in page.get("fields", []):
+            labels[field.get("id")] = field.get("label", field.get("id"))
     
     table = Table(title="Applicant Data Summary")
     table.add_column("Field", style="cyan")
@@ -167,6 +186,7 @@ def display_data_summary(data: dict[str, Any], schema_path: Optional[Path] = Non
     
     console.print(table)
     console.print(f"\n[bold]Summary:[/bold] {filled_count} filled, {empty_count} empty")
+    return filled_count, empty_count
 
 
 def merge_data_with_defaults(
@@ -183,12 +203,11 @@ def merge_data_with_defaults(
     Returns:
         Merged data dictionary
     """
-    if not template_path.exists():
+    try:
+        template = load_json(template_path)
+    except FileNotFoundError:
         return user_data
     
-    with open(template_path, 'r', encoding='utf-8') as f:
-        template = json.load(f)
-    
     template_flat = flatten_applicant_data(template)
     
     # User data takes precedence
@@ -386,15 +405,15 @@ class ApplicantDataLoader:
             self.load()
         return self.flat_data.copy()
     
-    def display_summary(self) -> None:
-        """Display a summary of the data."""
+    def display_summary(self) -> tuple[int, int]:
+        """Display a summary of the data and return the (filled, empty) counts."""
         if not self._loaded:
             self.load()
-        display_data_summary(self.flat_data, self.schema_path)
+        return display_data_summary(self.flat_data, self.schema_path)
 
 
 if __name__ == "__main__":
-    # Test
+    # Test; run as a module (python -m src.automation.data_loader) for the package imports
     base_path = Path(__file__).parent.parent.parent
     data_path = base_path / "output" / "applicant_template.json"
     schema_path = base_path / "output" / "fields_schema.json"
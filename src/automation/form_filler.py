@@ -2,15 +2,17 @@
 Form Filler - Automates filling the VIDEX visa application form.
 """
 
-import json
 import os
 from pathlib import Path
 from typing import Any, Optional
 from datetime import datetime
-from playwright.sync_api import sync_playwright, Page, Locator, TimeoutError as PlaywrightTimeout, Download
+from playwright.sync_api import sync_playwright, Browser, Page, Locator, TimeoutError as PlaywrightTimeout, Download
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
 
+from .browser_options import DEFAULT_OUTPUT_DIR, DEFAULT_SLOW_MO, browser_launch_options
+from .json_io import load_json
+
 console = Console()
 
 VIDEX_URL = "https://videx.diplo.de/videx/visum-erfassung/videx-kurzfristiger-aufenthalt"
@@ -31,10 +33,11 @@ class VidexFormFiller:
         applicant_data: dict[str, Any],
         schema_path: Optional[Path] = None,
         headless: bool = False,
-        slow_mo: int = 100,
+        slow_mo: int = DEFAULT_SLOW_MO,
         screenshot_on_error: bool = True,
         screenshot_dir: Optional[Path] = None,
-        output_dir: Optional[Path] = None
+        output_dir: Optional[Path] = None,
+        browser: Optional[Browser] = None
     ):
         """
         Initialize the form filler.
@@ -47,6 +50,7 @@ class VidexFormFiller:
             screenshot_on_error: Take screenshot when errors occur
             screenshot_dir: Directory to save screenshots
             output_dir: Directory to save the generated PDF
+            browser: Already running browser to reuse instead of launching one
         """
         self.data = applicant_data
         self.schema_path = schema_path
@@ -54,7 +58,8 @@ class VidexFormFiller:
         self.slow_mo = slow_mo
         self.screenshot_on_error = screenshot_on_error
         self.screenshot_dir = screenshot_dir or Path("./screenshots")
-        self.output_dir = output_dir or Path("./output")
+        self.output_dir = output_dir or DEFAULT_OUTPUT_DIR
+        self.browser = browser
         
         self.field_mappings: dict[str, dict] = {}
         self.page: Optional[Page] = None
@@ -63,13 +68,17 @@ class VidexFormFiller:
 
     def _load_field_mappings(self) -> None:
         """Load field mappings from schema."""
-        if not self.schema_path or not self.schema_path.exists():
+        schema = None
+        if self.schema_path:
+            try:
+                schema = load_json(self.schema_path)
+            except FileNotFoundError:
+                pass
+        
+        if schema is None:
             console.print("[yellow]No schema file, will use field IDs as selectors[/yellow]")
             return
         
-        with open(self.schema_path, 'r', encoding='utf-8') as f:
-            schema = json.load(f)
-        
         # Support both "sections" (new) and "form_pages" (old) structure
         pages_list = schema.get("sections", schema.get("form_pages", []))
         
@@ -507,172 +516,180 @@ class VidexFormFiller:
         Returns:
             Dictionary with 'fields' (field results) and 'pdf_path' (saved PDF path)
         """
-        results = {}
-        
         console.print("[bold blue]Starting VIDEX form automation...[/bold blue]")
         
+        if self.browser is not None:
+            return self._fill_with_browser(self.browser, submit, save_pdf)
+        
         with sync_playwright() as p:
             browser = p.chromium.launch(
-                headless=self.headless,
-                slow_mo=self.slow_mo,
-                downloads_path=str(self.output_dir)
-            )
-            context = browser.new_context(
-                viewport={"width": 1920, "height": 1080},
-                locale="en-US",
-                accept_downloads=True
+                **browser_launch_options(self.headless, self.slow_mo, self.output_dir)
             )
-            self.page = context.new_page()
-            
-            # Set up dialog handler for JavaScript alerts/confirms
-            self._setup_dialog_handler()
+            try:
+                return self._fill_with_browser(browser, submit, save_pdf)
+            finally:
+                browser.close()
+
+    def _fill_with_browser(self, browser: Browser, submit: bool, save_pdf: bool) -> dict[str, Any]:
+        """Fill the form in a fresh context of an already running browser."""
+        results = {}
+        
+        context = browser.new_context(
+            viewport={"width": 1920, "height": 1080},
+            locale="en-US",
+            accept_downloads=True
+        )
+        self.page = context.new_page()
+        
+        # Set up dialog handler for JavaScript alerts/confirms
+        self._setup_dialog_handler()
+        
+        try:
+            # Navigate to the form
+            console.print(f"[cyan]Navigating to {VIDEX_URL}[/cyan]")
+            self.page.goto(VIDEX_URL, timeout=60000)
             
+            # Wait for page content to actually load (Angular app needs time)
+            console.print(f"[cyan]Waiting for form to load...[/cyan]")
             try:
-                # Navigate to the form
-                console.print(f"[cyan]Navigating to {VIDEX_URL}[/cyan]")
-                self.page.goto(VIDEX_URL, timeout=60000)
-                
-                # Wait for page content to actually load (Angular app needs time)
-                console.print(f"[cyan]Waiting for form to load...[/cyan]")
-                try:
-                    # Wait for a specific form element to appear
-                    self.page.wait_for_selector("input[id='antragsteller.familienname']", timeout=30000)
-                    console.print(f"[green]Form loaded successfully[/green]")
-                except Exception:
-                    console.print(f"[yellow]Form elements not found, waiting longer...[/yellow]")
-                    self.page.wait_for_timeout(5000)
-                
-                # Debug: Check what we have on the page
+                # Wait for a specific form element to appear
+                self.page.wait_for_selector("input[id='antragsteller.familienname']", timeout=30000)
+                console.print(f"[green]Form loaded successfully[/green]")
+            except Exception:
+                console.print(f"[yellow]Form elements not found, waiting longer...[/yellow]")
+                self.page.wait_for_timeout(5000)
+            
+            # Debug: Check what we have on the page
+            input_count = self.page.locator("input").count()
+            select_count = self.page.locator("select").count()
+            console.print(f"[cyan]Found {input_count} inputs and {select_count} selects on page[/cyan]")
+            
+            # If no inputs found, try waiting more
+            if input_count == 0:
+                console.print(f"[yellow]No form elements detected, waiting for Angular to load...[/yellow]")
+                self.page.wait_for_timeout(5000)
+                self.page.wait_for_load_state("networkidle", timeout=30000)
                 input_count = self.page.locator("input").count()
                 select_count = self.page.locator("select").count()
-                console.print(f"[cyan]Found {input_count} inputs and {select_count} selects on page[/cyan]")
-                
-                # If no inputs found, try waiting more
-                if input_count == 0:
-                    console.print(f"[yellow]No form elements detected, waiting for Angular to load...[/yellow]")
-                    self.page.wait_for_timeout(5000)
-                    self.page.wait_for_load_state("networkidle", timeout=30000)
-                    input_count = self.page.locator("input").count()
-                    select_count = self.page.locator("select").count()
-                    console.print(f"[cyan]After wait: Found {input_count} inputs and {select_count} selects[/cyan]")
-                
-                # Handle any initial popups (cookies, warnings, etc.)
-                self._handle_popup_dialog()
-                
-                # Switch to English
-                self._switch_to_english()
-                
-                # Wait a bit more after language switch
-                self.page.wait_for_timeout(1000)
-                
-                # Take initial screenshot
-                self._take_screenshot("initial_page")
-                
-                page_num = 1
-                max_pages = 20
-                filled_fields = set()
+                console.print(f"[cyan]After wait: Found {input_count} inputs and {select_count} selects[/cyan]")
+            
+            # Handle any initial popups (cookies, warnings, etc.)
+            self._handle_popup_dialog()
+            
+            # Switch to English
+            self._switch_to_english()
+            
+            # Wait a bit more after language switch
+            self.page.wait_for_timeout(1000)
+            
+            # Take initial screenshot
+            self._take_screenshot("initial_page")
+            
+            page_num = 1
+            max_pages = 20
+            filled_fields = set()
+            
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                TextColumn("{task.completed}/{task.total}"),
+                console=console
+            ) as progress:
+                task = progress.add_task("Filling form...", total=len(self.data))
                 
-                with Progress(
-                    SpinnerColumn(),
-                    TextColumn("[progress.description]{task.description}"),
-                    BarColumn(),
-                    TextColumn("{task.completed}/{task.total}"),
-                    console=console
-                ) as progress:
-                    task = progress.add_task("Filling form...", total=len(self.data))
+                while page_num <= max_pages:
+                    progress.update(task, description=f"Page {page_num}: Filling fields...")
                     
-                    while page_num <= max_pages:
-                        progress.update(task, description=f"Page {page_num}: Filling fields...")
+                    # Multiple passes to handle conditional fields
+                    max_passes = 3
+                    for pass_num in range(max_passes):
+                        # Get visible fields on current page
+                        current_fields = self._get_current_page_fields()
                         
-                        # Multiple passes to handle conditional fields
-                        max_passes = 3
-                        for pass_num in range(max_passes):
-                            # Get visible fields on current page
-                            current_fields = self._get_current_page_fields()
-                            
-                            if not current_fields and pass_num == 0:
-                                console.print(f"[yellow]No visible fields on page {page_num}[/yellow]")
-                            
-                            # Count new fields to fill in this pass
-                            new_fields = [f for f in current_fields if f not in filled_fields]
-                            if not new_fields:
-                                break  # No new fields to fill
-                            
-                            # Fill each visible field
-                            for field_id in new_fields:
-                                value = self.data.get(field_id)
-                                if value is not None and value != "":
-                                    try:
-                                        success = self._fill_field(field_id, value)
-                                        results[field_id] = success
-                                    except Exception as fill_err:
-                                        console.print(f"[red]Exception filling {field_id}: {fill_err}[/red]")
-                                        results[field_id] = False
-                                    filled_fields.add(field_id)
-                                    progress.advance(task)
-                            
-                            # Wait briefly for any conditional fields to appear
-                            self.page.wait_for_timeout(300)
+                        if not current_fields and pass_num == 0:
+                            console.print(f"[yellow]No visible fields on page {page_num}[/yellow]")
                         
-                        # Take screenshot of completed page
-                        self._take_screenshot(f"page_{page_num}_filled")
+                        # Count new fields to fill in this pass
+                        new_fields = [f for f in current_fields if f not in filled_fields]
+                        if not new_fields:
+                            break  # No new fields to fill
                         
-                        # Check if we've filled all fields
-                        if len(filled_fields) >= len([k for k, v in self.data.items() if v]):
-                            console.print("[green]All fields filled![/green]")
-                            break
+                        # Fill each visible field
+                        for field_id in new_fields:
+                            value = self.data.get(field_id)
+                            if value is not None and value != "":
+                                try:
+                                    success = self._fill_field(field_id, value)
+                                    results[field_id] = success
+                                except Exception as fill_err:
+                                    console.print(f"[red]Exception filling {field_id}: {fill_err}[/red]")
+                                    results[field_id] = False
+                                filled_fields.add(field_id)
+                                progress.advance(task)
                         
-                        # Try to go to next page
-                        if not self._navigate_to_next_page():
-                            console.print("[cyan]No more pages to navigate.[/cyan]")
-                            break
-                        
-                        page_num += 1
-                        self.page.wait_for_timeout(1000)
-                
-                # Handle submission
-                if submit:
-                    self._submit_form()
-                else:
-                    console.print("[yellow]Form filled but NOT submitted (--submit flag not set)[/yellow]")
-                    self._take_screenshot("final_not_submitted")
-                
-                # Check if all fields were filled successfully before proceeding to PDF
-                success_count = sum(1 for v in results.values() if v)
-                total_fields = len(self.data)
-                
-                if success_count < total_fields:
-                    console.print(f"[yellow]Warning: Only {success_count}/{total_fields} fields filled[/yellow]")
-                    failed_fields = [k for k, v in results.items() if not v]
-                    if failed_fields:
-                        console.print(f"[yellow]Failed fields: {failed_fields[:10]}{'...' if len(failed_fields) > 10 else ''}[/yellow]")
-                
-                # Save PDF only after all fields are filled
-                saved_path = None
-                if save_pdf:
-                    console.print(f"\n[bold cyan]All {success_count} fields filled. Saving form as PDF...[/bold cyan]")
-                    saved_path = self._save_pdf()
-                
-                # Summary
-                fail_count = len(results) - success_count
-                
-                console.print(f"\n[bold]Form Filling Summary:[/bold]")
-                console.print(f"  [green]Successful: {success_count}[/green]")
-                console.print(f"  [red]Failed: {fail_count}[/red]")
-                if saved_path:
-                    console.print(f"  [cyan]PDF saved: {saved_path}[/cyan]")
-                
-            except Exception as e:
-                console.print(f"[bold red]Error during form filling: {e}[/bold red]")
-                if self.screenshot_on_error:
-                    self._take_screenshot("error")
-                raise FormFillerError(str(e))
-            finally:
-                # Keep browser open briefly for debugging if not headless
-                if not self.headless:
-                    console.print("[cyan]Browser will close in 5 seconds...[/cyan]")
-                    self.page.wait_for_timeout(5000)
-                browser.close()
+                        # Wait briefly for any conditional fields to appear
+                        self.page.wait_for_timeout(300)
+                    
+                    # Take screenshot of completed page
+                    self._take_screenshot(f"page_{page_num}_filled")
+                    
+                    # Check if we've filled all fields
+                    if len(filled_fields) >= len([k for k, v in self.data.items() if v]):
+                        console.print("[green]All fields filled![/green]")
+                        break
+                    
+                    # Try to go to next page
+                    if not self._navigate_to_next_page():
+                        console.print("[cyan]No more pages to navigate.[/cyan]")
+                        break
+                    
+                    page_num += 1
+                    self.page.wait_for_timeout(1000)
+            
+            # Handle submission
+            if submit:
+                self._submit_form()
+            else:
+                console.print("[yellow]Form filled but NOT submitted (--submit flag not set)[/yellow]")
+                self._take_screenshot("final_not_submitted")
+            
+            # Check if all fields were filled successfully before proceeding to PDF
+            success_count = sum(1 for v in results.values() if v)
+            total_fields = len(self.data)
+            
+            if success_count < total_fields:
+                console.print(f"[yellow]Warning: Only {success_count}/{total_fields} fields filled[/yellow]")
+                failed_fields = [k for k, v in results.items() if not v]
+                if failed_fields:
+                    console.print(f"[yellow]Failed fields: {failed_fields[:10]}{'...' if len(failed_fields) > 10 else ''}[/yellow]")
+            
+            # Save PDF only after all fields are filled
+            saved_path = None
+            if save_pdf:
+                console.print(f"\n[bold cyan]All {success_count} fields filled. Saving form as PDF...[/bold cyan]")
+                saved_path = self._save_pdf()
+            
+            # Summary
+            fail_count = len(results) - success_count
+            
+            console.print(f"\n[bold]Form Filling Summary:[/bold]")
+            console.print(f"  [green]Successful: {success_count}[/green]")
+            console.print(f"  [red]Failed: {fail_count}[/red]")
+            if saved_path:
+                console.print(f"  [cyan]PDF saved: {saved_path}[/cyan]")
+            
+        except Exception as e:
+            console.print(f"[bold red]Error during form filling: {e}[/bold red]")
+            if self.screenshot_on_error:
+                self._take_screenshot("error")
+            raise FormFillerError(str(e))
+        finally:
+            # Keep browser open briefly for debugging if not headless
+            if not self.headless:
+                console.print("[cyan]Browser will close in 5 seconds...[/cyan]")
+                self.page.wait_for_timeout(5000)
+            context.close()
         
         return {
             "fields": results,
@@ -974,7 +991,8 @@ def fill_videx_form(
     headless: bool = False,
     submit: bool = False,
     save_pdf: bool = True,
-    output_dir: Optional[Path] = None
+    output_dir: Optional[Path] = None,
+    browser: Optional[Browser] = None
 ) -> dict[str, Any]:
     """
     Convenience function to fill the VIDEX form.
@@ -987,6 +1005,7 @@ def fill_videx_form(
         submit: Actually submit the form
         save_pdf: Save the form as PDF
         output_dir: Directory to save the PDF
+        browser: Already running browser to reuse (e.g. from the browser server)
     
     Returns:
         Dictionary with field results and PDF path
@@ -1010,14 +1029,15 @@ def fill_videx_form(
         applicant_data=loader.get_all_values(),
         schema_path=schema_path,
         headless=headless,
-        output_dir=output_dir or data_path.parent
+        output_dir=output_dir or data_path.parent,
+        browser=browser
     )
     
     return filler.fill_form(submit=submit, save_pdf=save_pdf)
 
 
 if __name__ == "__main__":
-    # Test
+    # Test; run as a module (python -m src.automation.form_filler) for the package imports
     base_path = Path(__file__).parent.parent.parent
     data_path = base_path / "output" / "applicant_template.json"
     schema_path = base_path / "output" / "fields_schema.json"
@@ -0,0 +1,54 @@
+"""
+JSON I/O - Shared JSON parsing and serialization for schema, template and applicant files.
+
+orjson and msgspec are optional; the first one installed is used, with the
+standard library json module as the fallback. All backends produce the same
+indented UTF-8 output.
+"""
+
+import json
+from dataclasses import fields
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional, fastest backend
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # optional, used when orjson is missing
+    msgspec = None
+
+
+def _dataclass_fields(obj) -> dict:
+    """json encoder hook: shallow field dict of a dataclass."""
+    return {f.name: getattr(obj, f.name) for f in fields(obj)}
+
+
+def load_json(path: Path) -> Any:
+    """
+    Parse a JSON file.
+    
+    Raises:
+        FileNotFoundError: If the file does not exist
+        ValueError: If the file is not valid JSON
+    """
+    with open(path, 'rb') as f:
+        raw = f.read()
+    
+    if orjson is not None:
+        return orjson.loads(raw)
+    if msgspec is not None:
+        return msgspec.json.decode(raw)
+    return json.loads(raw)
+
+
+def dump_json(obj: Any) -> bytes:
+    """Serialize plain data or dataclasses as indented UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    if msgspec is not None:
+        return msgspec.json.format(msgspec.json.encode(obj), indent=2)
+    return json.dumps(obj, indent=2, ensure_ascii=False, default=_dataclass_fields).encode('utf-8')
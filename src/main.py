@@ -2,97 +2,180 @@
 VIDEX Form Automation - Main CLI Entry Point
 
 Usage:
-    python -m src.main scrape [--headless]
-    python -m src.main fill --data <path> [--headless] [--submit]
+    python -m src.main scrape [--headed]
+    python -m src.main fill --data <path> [--headed] [--submit]
+    python -m src.main serve [--socket <path>] [--headed]
     python -m src.main generate --schema <path>
 """
 
 import argparse
+import os
+import re
 import sys
 from pathlib import Path
-from rich.console import Console
-from rich.panel import Panel
 
-console = Console()
+# Rich is only imported when writing to a terminal; piped output is plain text
+_console = None
+
+# Rich markup tags, with any backslashes in front (same pattern as rich.markup)
+_MARKUP_TAG_RE = re.compile(r"(\\*)\[([a-z#/@][^[]*?)]")
 
 # Base paths
 BASE_DIR = Path(__file__).parent.parent
 OUTPUT_DIR = BASE_DIR / "output"
 SRC_DIR = BASE_DIR / "src"
 
+# Sidecar with recent `validate` verdicts (valid flag, missing field IDs and
+# filled/empty counts), keyed by data hash + schema mtime. Applicant values are
+# never stored. Bump VALIDATE_CACHE_VERSION whenever validation changes so
+# stale verdicts are not reused.
+VALIDATE_CACHE_PATH = OUTPUT_DIR / ".validate.cache"
+VALIDATE_CACHE_SIZE = 64
+VALIDATE_CACHE_VERSION = 3
+
+# Commands that write into OUTPUT_DIR
+OUTPUT_COMMANDS = {"scrape", "fill", "generate", "template"}
+
+
+def _rich_console():
+    """Create the Rich console on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
+
+def _escape(value: object) -> str:
+    """Escape a path, field ID or error message for use inside Rich markup (like rich.markup.escape)."""
+    text = _MARKUP_TAG_RE.sub(lambda m: f"{m.group(1)}{m.group(1)}\\[{m.group(2)}]", str(value))
+    if text.endswith("\\") and not text.endswith("\\\\"):
+        text += "\\"
+    return text
+
+
+def _plain(message: str) -> str:
+    """Strip Rich markup the same way the console would render it."""
+    parts = []
+    position = 0
+    for match in _MARKUP_TAG_RE.finditer(message):
+        # Outside tags, "\[" is an escaped bracket
+        parts.append(message[position:match.start()].replace("\\[", "["))
+        backslashes, escaped = divmod(len(match.group(1)), 2)
+        parts.append("\\" * backslashes)
+        if escaped:
+            parts.append(f"[{match.group(2)}]")
+        position = match.end()
+    parts.append(message[position:].replace("\\[", "["))
+    return "".join(parts)
+
+
+def cout(message: str = "") -> None:
+    """Print a message, styled with Rich markup on a terminal and as plain text otherwise."""
+    if sys.stdout.isatty():
+        _rich_console().print(message)
+    else:
+        print(_plain(message))
+
+
+def cout_panel(message: str, **panel_options) -> None:
+    """Print a message in a boxed panel on a terminal and as plain text otherwise."""
+    if sys.stdout.isatty():
+        from rich.panel import Panel
+        _rich_console().print(Panel.fit(message, **panel_options))
+    else:
+        print(_plain(message))
+
+
+def _ensure_output_dir() -> None:
+    """Create the output directory; a single mkdir syscall when it already exists."""
+    try:
+        os.mkdir(OUTPUT_DIR)
+    except FileExistsError:
+        pass
+
+
+def _debug_enabled(args: argparse.Namespace) -> bool:
+    """Whether --verbose or VIDEX_DEBUG asks for debugging output."""
+    return bool(getattr(args, "verbose", False) or os.environ.get("VIDEX_DEBUG"))
+
+
+def _print_traceback(args: argparse.Namespace) -> None:
+    """Print the active exception's traceback when --verbose or VIDEX_DEBUG is set."""
+    if _debug_enabled(args):
+        import traceback
+        traceback.print_exc()
+
 
 def cmd_scrape(args: argparse.Namespace) -> int:
     """Run the form scraper to analyze the VIDEX form."""
+    import importlib
+    import threading
+    
+    # Import the generators (and orjson) in the background while the
+    # network-bound scrape runs, so they are ready once it finishes
+    threading.Thread(
+        target=importlib.import_module,
+        args=(".scraper.schema_generator", __package__),
+        daemon=True
+    ).start()
+    
     from .scraper.form_scraper import scrape_videx_form
-    from .scraper.schema_generator import (
-        generate_applicant_template,
-        generate_flat_template,
-        generate_pydantic_models,
-        generate_field_mappings
-    )
     
-    console.print(Panel.fit(
+    cout_panel(
         "[bold blue]VIDEX Form Scraper[/bold blue]\n"
         "Analyzing form structure and extracting field definitions..."
-    ))
-    
-    # Create output directory
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    )
     
     schema_path = OUTPUT_DIR / "fields_schema.json"
     
     try:
-        # Run scraper
-        schema = scrape_videx_form(
-            headless=args.headless,
-            output_path=schema_path,
-            language=args.language
-        )
-        
-        if not schema.sections:
-            console.print("[yellow]Warning: No form pages were scraped. The form structure may have changed.[/yellow]")
-            return 1
-        
-        console.print("\n[bold cyan]Generating templates and mappings...[/bold cyan]")
-        
-        # Generate templates
-        generate_applicant_template(
-            schema_path,
-            OUTPUT_DIR / "applicant_template.json"
-        )
-        
-        generate_flat_template(
-            schema_path,
-            OUTPUT_DIR / "applicant_flat.json"
-        )
-        
-        # Generate code files
-        generate_pydantic_models(
-            schema_path,
-            SRC_DIR / "automation" / "models.py"
-        )
+        from concurrent.futures import ThreadPoolExecutor
         
-        generate_field_mappings(
-            schema_path,
-            SRC_DIR / "automation" / "field_mappings.py"
-        )
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            generation = []
+            
+            def start_generation(scraped) -> None:
+                # Called once the schema is saved but before the browser is
+                # closed, so code generation overlaps with browser teardown
+                if scraped.sections:
+                    cout("\n[bold cyan]Generating templates and mappings...[/bold cyan]")
+                    from .scraper.schema_generator import generate_all
+                    generation.append(executor.submit(generate_all, schema_path, OUTPUT_DIR, SRC_DIR / "automation"))
+            
+            # Run scraper
+            schema = scrape_videx_form(
+                headless=args.headless,
+                output_path=schema_path,
+                language=args.language,
+                on_complete=start_generation,
+                cdp_endpoint=args.cdp_endpoint,
+                debug=_debug_enabled(args)
+            )
+            
+            if not schema.sections:
+                cout("[yellow]Warning: No form pages were scraped. The form structure may have changed.[/yellow]")
+                return 1
+            
+            # Wait for the templates and code files
+            for future in generation:
+                future.result()
         
-        console.print(Panel.fit(
+        cout_panel(
             "[bold green]Scraping Complete![/bold green]\n\n"
-            f"Schema saved to: {schema_path}\n"
-            f"Template saved to: {OUTPUT_DIR / 'applicant_template.json'}\n"
-            f"Flat template: {OUTPUT_DIR / 'applicant_flat.json'}\n\n"
+            f"Schema saved to: {_escape(schema_path)}\n"
+            f"Template saved to: {_escape(OUTPUT_DIR / 'applicant_template.json')}\n"
+            f"Flat template: {_escape(OUTPUT_DIR / 'applicant_flat.json')}\n\n"
             "[cyan]Next steps:[/cyan]\n"
             "1. Edit the applicant template with your data\n"
             "2. Run: python -m src.main fill --data output/applicant_template.json"
-        ))
+        )
         
         return 0
         
     except Exception as e:
-        console.print(f"[bold red]Scraping failed: {e}[/bold red]")
-        import traceback
-        traceback.print_exc()
+        cout(f"[bold red]Scraping failed: {_escape(e)}[/bold red]")
+        _print_traceback(args)
         return 1
 
 
@@ -108,63 +191,87 @@ def cmd_template(args: argparse.Namespace) -> int:
     with open(output_path, 'w') as f:
         json.dump(template, f, indent=2)
     
-    console.print(f"[green]English template saved to: {output_path}[/green]")
-    console.print("\n[cyan]Edit this file with your applicant data and run:[/cyan]")
-    console.print(f"  python -m src.main fill --data {output_path}")
+    cout(f"[green]English template saved to: {_escape(output_path)}[/green]")
+    cout("\n[cyan]Edit this file with your applicant data and run:[/cyan]")
+    cout(f"  python -m src.main fill --data {_escape(output_path)}")
     
     return 0
 
 
 def cmd_fill(args: argparse.Namespace) -> int:
     """Fill the VIDEX form with applicant data."""
-    from .automation.form_filler import fill_videx_form
-    from .automation.data_loader import ApplicantDataLoader
-    
     data_path = Path(args.data)
-    if not data_path.exists():
-        console.print(f"[red]Data file not found: {data_path}[/red]")
+    try:
+        data_path.stat()
+    except FileNotFoundError:
+        cout(f"[red]Data file not found: {_escape(data_path)}[/red]")
         return 1
     
     schema_path = OUTPUT_DIR / "fields_schema.json"
-    if not schema_path.exists():
-        console.print("[yellow]Warning: No schema file found. Run 'scrape' first for better results.[/yellow]")
+    try:
+        schema_path.stat()
+    except FileNotFoundError:
+        cout("[yellow]Warning: No schema file found. Run 'scrape' first for better results.[/yellow]")
         schema_path = None
     
     # Load defaults if specified or use default path
     defaults_path = Path(args.defaults) if args.defaults else OUTPUT_DIR / "defaults.json"
-    if not defaults_path.exists():
+    try:
+        defaults_path.stat()
+    except FileNotFoundError:
         defaults_path = None
     
     output_dir = Path(args.output) if args.output else OUTPUT_DIR
     save_pdf = not args.no_pdf
     
-    console.print(Panel.fit(
+    cout_panel(
         "[bold blue]VIDEX Form Filler[/bold blue]\n"
-        f"Data file: {data_path}\n"
-        f"Defaults: {defaults_path or 'None'}\n"
-        f"Output dir: {output_dir}\n"
+        f"Data file: {_escape(data_path)}\n"
+        f"Defaults: {_escape(defaults_path or 'None')}\n"
+        f"Output dir: {_escape(output_dir)}\n"
         f"Headless: {args.headless}\n"
         f"Save PDF: {save_pdf}\n"
         f"Submit: {args.submit}"
-    ))
+    )
     
     if args.submit:
-        console.print("[bold yellow]WARNING: Form will be submitted![/bold yellow]")
-        response = input("Type 'yes' to confirm: ")
-        if response.lower() != 'yes':
-            console.print("[cyan]Submission cancelled.[/cyan]")
-            return 0
+        cout("[bold yellow]WARNING: Form will be submitted![/bold yellow]")
+        if not args.yes:
+            if not sys.stdin.isatty():
+                cout("[red]Refusing to submit without --yes in non-interactive mode[/red]")
+                return 2
+            response = input("Type 'yes' to confirm: ")
+            if response.lower() != 'yes':
+                cout("[cyan]Submission cancelled.[/cyan]")
+                return 0
     
     try:
-        results = fill_videx_form(
-            data_path=data_path,
-            schema_path=schema_path,
-            defaults_path=defaults_path,
-            headless=args.headless,
-            submit=args.submit,
-            save_pdf=save_pdf,
-            output_dir=output_dir
-        )
+        from .automation.browser_server import SOCKET_ENV_VAR, submit_fill_job
+        
+        browser_sock = os.environ.get(SOCKET_ENV_VAR)
+        if browser_sock:
+            # Reuse the browser of a running `videx serve`
+            cout(f"[cyan]Using browser server at {_escape(browser_sock)}[/cyan]")
+            results = submit_fill_job(
+                Path(browser_sock),
+                data_path=data_path,
+                schema_path=schema_path,
+                defaults_path=defaults_path,
+                submit=args.submit,
+                save_pdf=save_pdf,
+                output_dir=output_dir
+            )
+        else:
+            from .automation.form_filler import fill_videx_form
+            results = fill_videx_form(
+                data_path=data_path,
+                schema_path=schema_path,
+                defaults_path=defaults_path,
+                headless=args.headless,
+                submit=args.submit,
+                save_pdf=save_pdf,
+                output_dir=output_dir
+            )
         
         # Summary
         success = results.get("success_count", 0)
@@ -176,244 +283,405 @@ def cmd_fill(args: argparse.Namespace) -> int:
         summary_text += f"Fields failed: {failed}"
         
         if pdf_path:
-            summary_text += f"\n\n[bold cyan]PDF saved to:[/bold cyan]\n{pdf_path}"
+            summary_text += f"\n\n[bold cyan]PDF saved to:[/bold cyan]\n{_escape(pdf_path)}"
         
-        console.print(Panel.fit(summary_text))
+        cout_panel(summary_text)
         
         return 0 if failed == 0 else 1
         
     except Exception as e:
-        console.print(f"[bold red]Form filling failed: {e}[/bold red]")
-        import traceback
-        traceback.print_exc()
+        cout(f"[bold red]Form filling failed: {_escape(e)}[/bold red]")
+        _print_traceback(args)
+        return 1
+
+
+def cmd_serve(args: argparse.Namespace) -> int:
+    """Keep a browser running and serve fill jobs over a Unix socket."""
+    from .automation.browser_server import DEFAULT_SOCKET_PATH, serve
+    
+    socket_path = Path(args.socket) if args.socket else DEFAULT_SOCKET_PATH
+    
+    cout_panel(
+        "[bold blue]VIDEX Browser Server[/bold blue]\n"
+        f"Socket: {_escape(socket_path)}\n"
+        f"Headless: {args.headless}\n"
+        f"Idle timeout: {args.idle_timeout:.0f}s\n"
+        f"Max jobs per browser: {args.max_jobs}"
+    )
+    
+    try:
+        serve(
+            socket_path=socket_path,
+            headless=args.headless,
+            idle_timeout=args.idle_timeout,
+            max_jobs=args.max_jobs
+        )
+        return 0
+        
+    except Exception as e:
+        cout(f"[bold red]Browser server failed: {_escape(e)}[/bold red]")
+        _print_traceback(args)
         return 1
 
 
 def cmd_generate(args: argparse.Namespace) -> int:
     """Generate templates and code from an existing schema."""
-    from .scraper.schema_generator import (
-        generate_applicant_template,
-        generate_flat_template,
-        generate_pydantic_models,
-        generate_field_mappings
-    )
+    from .scraper.schema_generator import generate_all
     
     schema_path = Path(args.schema)
-    if not schema_path.exists():
-        console.print(f"[red]Schema file not found: {schema_path}[/red]")
+    try:
+        schema_path.stat()
+    except FileNotFoundError:
+        cout(f"[red]Schema file not found: {_escape(schema_path)}[/red]")
         return 1
     
-    console.print(Panel.fit(
+    cout_panel(
         "[bold blue]Template Generator[/bold blue]\n"
-        f"Schema: {schema_path}"
-    ))
+        f"Schema: {_escape(schema_path)}"
+    )
     
     try:
-        OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-        
-        generate_applicant_template(
-            schema_path,
-            OUTPUT_DIR / "applicant_template.json"
-        )
+        generate_all(schema_path, OUTPUT_DIR, SRC_DIR / "automation", use_typeddict=args.typeddict)
         
-        generate_flat_template(
-            schema_path,
-            OUTPUT_DIR / "applicant_flat.json"
-        )
-        
-        generate_pydantic_models(
-            schema_path,
-            SRC_DIR / "automation" / "models.py"
-        )
-        
-        generate_field_mappings(
-            schema_path,
-            SRC_DIR / "automation" / "field_mappings.py"
-        )
-        
-        console.print("[bold green]Generation complete![/bold green]")
+        cout("[bold green]Generation complete![/bold green]")
         return 0
         
     except Exception as e:
-        console.print(f"[bold red]Generation failed: {e}[/bold red]")
+        cout(f"[bold red]Generation failed: {_escape(e)}[/bold red]")
+        _print_traceback(args)
         return 1
 
 
+def _load_validate_cache() -> dict:
+    """Load cached validation results ({} if missing or unreadable)."""
+    import json
+    
+    try:
+        with open(VALIDATE_CACHE_PATH, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_validate_cache(cache: dict) -> None:
+    """Write the validation cache atomically so parallel runs never see a partial file."""
+    import json
+    
+    # Keep only the most recent entries; older cache versions are dropped
+    version_prefix = f"{VALIDATE_CACHE_VERSION}:"
+    entries = [item for item in cache.items() if item[0].startswith(version_prefix)][-VALIDATE_CACHE_SIZE:]
+    tmp_path = VALIDATE_CACHE_PATH.with_name(f"{VALIDATE_CACHE_PATH.name}.{os.getpid()}.tmp")
+    try:
+        # Owner-only: the missing field IDs still say something about an applicant
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with open(fd, 'w', encoding='utf-8') as f:
+            json.dump(dict(entries), f)
+        os.replace(tmp_path, VALIDATE_CACHE_PATH)
+    except OSError:
+        pass
+
+
+def _report_validation(is_valid: bool, missing: list[str]) -> int:
+    """Print the validation result and return the exit code."""
+    if is_valid:
+        cout("\n[bold green]Validation passed! All required fields are filled.[/bold green]")
+        return 0
+    
+    cout(f"\n[bold red]Validation failed! Missing required fields:[/bold red]")
+    for field in missing:
+        cout(f"  - {_escape(field)}")
+    return 1
+
+
 def cmd_validate(args: argparse.Namespace) -> int:
     """Validate applicant data against the schema."""
-    from .automation.data_loader import ApplicantDataLoader
+    import hashlib
     
     data_path = Path(args.data)
-    if not data_path.exists():
-        console.print(f"[red]Data file not found: {data_path}[/red]")
+    try:
+        data_bytes = data_path.read_bytes()
+    except FileNotFoundError:
+        cout(f"[red]Data file not found: {_escape(data_path)}[/red]")
         return 1
     
     schema_path = OUTPUT_DIR / "fields_schema.json"
-    if not schema_path.exists():
-        console.print("[yellow]No schema file found. Run 'scrape' first.[/yellow]")
+    try:
+        schema_mtime = schema_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        cout("[yellow]No schema file found. Run 'scrape' first.[/yellow]")
         schema_path = None
+        schema_mtime = 0
+    
+    # The result only depends on the validation code, the data content and the schema version
+    cache_key = f"{VALIDATE_CACHE_VERSION}:{hashlib.sha256(data_bytes).hexdigest()}:{schema_mtime}"
+    cache = {} if args.no_cache else _load_validate_cache()
+    cached = cache.get(cache_key)
     
     try:
+        if cached is not None:
+            # Applicant values are never cached, so a hit only reports the counts
+            cout("[cyan]Data and schema unchanged since last validation, using cached result[/cyan]")
+            cout(f"\n[bold]Summary:[/bold] {cached['filled']} filled, {cached['empty']} empty")
+            return _report_validation(cached["valid"], cached["missing"])
+        
+        from .automation.data_loader import ApplicantDataLoader
+        
         loader = ApplicantDataLoader(data_path, schema_path)
         loader.load()
-        loader.display_summary()
+        filled, empty = loader.display_summary()
         
         is_valid, missing = loader.validate()
         
-        if is_valid:
-            console.print("\n[bold green]Validation passed! All required fields are filled.[/bold green]")
-            return 0
-        else:
-            console.print(f"\n[bold red]Validation failed! Missing required fields:[/bold red]")
-            for field in missing:
-                console.print(f"  - {field}")
-            return 1
+        if not args.no_cache:
+            cache.pop(cache_key, None)
+            cache[cache_key] = {"valid": is_valid, "missing": missing, "filled": filled, "empty": empty}
+            _save_validate_cache(cache)
+        
+        return _report_validation(is_valid, missing)
             
     except Exception as e:
-        console.print(f"[bold red]Validation failed: {e}[/bold red]")
+        cout(f"[bold red]Validation failed: {_escape(e)}[/bold red]")
         return 1
 
 
-def main() -> int:
-    """Main entry point."""
-    parser = argparse.ArgumentParser(
-        prog="videx",
-        description="VIDEX Visa Application Form Automation Tool",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  # Scrape the form to discover all fields
-  python -m src.main scrape
-  
-  # Scrape in headless mode (no visible browser)
-  python -m src.main scrape --headless
-  
-  # Fill the form with applicant data
-  python -m src.main fill --data output/applicant_template.json
-  
-  # Fill and submit the form
-  python -m src.main fill --data output/applicant_template.json --submit
-  
-  # Validate applicant data
-  python -m src.main validate --data output/applicant_template.json
-  
-  # Regenerate templates from existing schema
-  python -m src.main generate --schema output/fields_schema.json
-        """
+def _add_verbose_argument(parser: argparse.ArgumentParser, default: object = False) -> None:
+    """Add the --verbose flag (accepted both before and after the command name)."""
+    parser.add_argument(
+        "-v", "--verbose",
+        action="store_true",
+        default=default,
+        help="Print full tracebacks on errors (or set VIDEX_DEBUG=1)"
     )
-    
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
-    
-    # Scrape command
-    scrape_parser = subparsers.add_parser(
-        "scrape",
-        help="Scrape the VIDEX form to extract field definitions"
+
+
+def _add_headless_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add --headed; browsers run headless unless it is given."""
+    parser.add_argument(
+        "--headed",
+        dest="headless",
+        action="store_false",
+        help="Show the browser window (default: headless)"
     )
-    scrape_parser.add_argument(
+    # Kept so existing scripts passing --headless keep working
+    parser.add_argument(
         "--headless",
+        dest="headless",
         action="store_true",
-        help="Run browser in headless mode"
+        help=argparse.SUPPRESS
     )
-    scrape_parser.add_argument(
+    parser.set_defaults(headless=True)
+
+
+def _build_scrape_parser(parser: argparse.ArgumentParser) -> None:
+    """Add the arguments of the scrape command."""
+    _add_headless_arguments(parser)
+    parser.add_argument(
         "--language",
         choices=["en", "de"],
         default="en",
         help="Language to use (en=English, de=German). Default: en"
     )
-    
-    # Fill command
-    fill_parser = subparsers.add_parser(
-        "fill",
-        help="Fill the VIDEX form with applicant data"
+    parser.add_argument(
+        "--cdp-endpoint",
+        default=os.environ.get("VIDEX_CDP_ENDPOINT"),
+        help="Reuse a running Chromium via its CDP endpoint, e.g. http://localhost:9222 "
+             "(default: $VIDEX_CDP_ENDPOINT, otherwise launch a new browser)"
     )
-    fill_parser.add_argument(
+
+
+def _build_fill_parser(parser: argparse.ArgumentParser) -> None:
+    """Add the arguments of the fill command."""
+    parser.add_argument(
         "--data",
         required=True,
         help="Path to applicant data JSON file"
     )
-    fill_parser.add_argument(
+    parser.add_argument(
         "--output",
         help="Directory to save the PDF output (default: output/)"
     )
-    fill_parser.add_argument(
-        "--headless",
-        action="store_true",
-        help="Run browser in headless mode"
-    )
-    fill_parser.add_argument(
+    _add_headless_arguments(parser)
+    parser.add_argument(
         "--no-pdf",
         action="store_true",
         help="Don't save the form as PDF"
     )
-    fill_parser.add_argument(
+    parser.add_argument(
         "--defaults",
         help="Path to defaults JSON file (default: output/defaults.json)"
     )
-    fill_parser.add_argument(
+    parser.add_argument(
         "--submit",
         action="store_true",
         help="Actually submit the form (default: just fill without submitting)"
     )
-    
-    # Generate command
-    generate_parser = subparsers.add_parser(
-        "generate",
-        help="Generate templates from an existing schema file"
+    parser.add_argument(
+        "-y", "--yes",
+        action="store_true",
+        help="Skip the submit confirmation prompt (required with --submit when not on a terminal)"
+    )
+
+
+def _build_serve_parser(parser: argparse.ArgumentParser) -> None:
+    """Add the arguments of the serve command."""
+    parser.add_argument(
+        "--socket",
+        help="Unix socket to listen on (default: $XDG_RUNTIME_DIR/videx-browser.sock, "
+             "or /tmp/videx-browser.sock when XDG_RUNTIME_DIR is not set)"
     )
-    generate_parser.add_argument(
+    _add_headless_arguments(parser)
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=600.0,
+        help="Shut down after this many seconds without a job (default: 600)"
+    )
+    parser.add_argument(
+        "--max-jobs",
+        type=int,
+        default=50,
+        help="Relaunch the browser after this many jobs (default: 50)"
+    )
+
+
+def _build_generate_parser(parser: argparse.ArgumentParser) -> None:
+    """Add the arguments of the generate command."""
+    parser.add_argument(
         "--schema",
         required=True,
         help="Path to the schema JSON file"
     )
-    
-    # Validate command
-    validate_parser = subparsers.add_parser(
-        "validate",
-        help="Validate applicant data against the schema"
+    parser.add_argument(
+        "--typeddict",
+        action="store_true",
+        help="Generate the section models as TypedDicts (no per-section validation)"
     )
-    validate_parser.add_argument(
+
+
+def _build_validate_parser(parser: argparse.ArgumentParser) -> None:
+    """Add the arguments of the validate command."""
+    parser.add_argument(
         "--data",
         required=True,
         help="Path to applicant data JSON file"
     )
-    
-    # Template command
-    template_parser = subparsers.add_parser(
-        "template",
-        help="Generate an English-friendly template JSON file"
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always re-validate, ignoring results cached in output/.validate.cache"
     )
-    template_parser.add_argument(
+
+
+def _build_template_parser(parser: argparse.ArgumentParser) -> None:
+    """Add the arguments of the template command."""
+    parser.add_argument(
         "--output",
         help="Path for the output template file (default: output/english_template.json)"
     )
+
+
+# Command name -> (help text, argument builder, handler)
+COMMANDS = {
+    "scrape": ("Scrape the VIDEX form to extract field definitions", _build_scrape_parser, cmd_scrape),
+    "fill": ("Fill the VIDEX form with applicant data", _build_fill_parser, cmd_fill),
+    "serve": ("Keep a browser running to speed up repeated fills", _build_serve_parser, cmd_serve),
+    "generate": ("Generate templates from an existing schema file", _build_generate_parser, cmd_generate),
+    "validate": ("Validate applicant data against the schema", _build_validate_parser, cmd_validate),
+    "template": ("Generate an English-friendly template JSON file", _build_template_parser, cmd_template),
+}
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the full CLI parser with all subcommands."""
+    parser = argparse.ArgumentParser(
+        prog="videx",
+        description="VIDEX Visa Application Form Automation Tool",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Scrape the form to discover all fields
+  python -m src.main scrape
+  
+  # Scrape with a visible browser window
+  python -m src.main scrape --headed
+  
+  # Fill the form with applicant data
+  python -m src.main fill --data output/applicant_template.json
+  
+  # Keep a browser running and reuse it for subsequent fills
+  python -m src.main serve &
+  VIDEX_BROWSER_SOCK=${XDG_RUNTIME_DIR:-/tmp}/videx-browser.sock python -m src.main fill --data output/applicant_template.json
+  
+  # Fill and submit the form
+  python -m src.main fill --data output/applicant_template.json --submit
+  
+  # Submit without the confirmation prompt (CI / batch runs)
+  python -m src.main fill --data output/applicant_template.json --submit --yes
+  
+  # Validate applicant data
+  python -m src.main validate --data output/applicant_template.json
+  
+  # Regenerate templates from existing schema
+  python -m src.main generate --schema output/fields_schema.json
+        """
+    )
+    
+    _add_verbose_argument(parser)
+    
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
     
-    args = parser.parse_args()
+    for name, (help_text, build, _) in COMMANDS.items():
+        subparser = subparsers.add_parser(name, help=help_text)
+        build(subparser)
+        # SUPPRESS keeps a top-level --verbose from being reset by the subparser
+        _add_verbose_argument(subparser, default=argparse.SUPPRESS)
+    
+    return parser
+
+
+def _parse_args(argv: list[str]) -> tuple[argparse.Namespace, argparse.ArgumentParser]:
+    """
+    Parse the command line.
+    
+    When the first argument is a known command only that command's parser is
+    built; the full parser is only needed for top-level help and errors.
+    """
+    if argv and argv[0] in COMMANDS:
+        command = argv[0]
+        help_text, build, _ = COMMANDS[command]
+        parser = argparse.ArgumentParser(prog=f"videx {command}", description=help_text)
+        build(parser)
+        _add_verbose_argument(parser)
+        args = parser.parse_args(argv[1:])
+        args.command = command
+        return args, parser
+    
+    parser = _build_parser()
+    return parser.parse_args(argv), parser
+
+
+def main() -> int:
+    """Main entry point."""
+    args, parser = _parse_args(sys.argv[1:])
     
     if not args.command:
         parser.print_help()
         return 0
     
-    # Print banner
-    console.print(Panel.fit(
-        "[bold cyan]VIDEX Form Automation Tool[/bold cyan]\n"
-        "Automate German Schengen visa applications",
-        border_style="cyan"
-    ))
+    # Print banner (decorative, so terminal only)
+    if sys.stdout.isatty():
+        cout_panel(
+            "[bold cyan]VIDEX Form Automation Tool[/bold cyan]\n"
+            "Automate German Schengen visa applications",
+            border_style="cyan"
+        )
+    
+    if args.command in OUTPUT_COMMANDS:
+        _ensure_output_dir()
     
     # Dispatch to command handler
-    if args.command == "scrape":
-        return cmd_scrape(args)
-    elif args.command == "fill":
-        return cmd_fill(args)
-    elif args.command == "generate":
-        return cmd_generate(args)
-    elif args.command == "validate":
-        return cmd_validate(args)
-    elif args.command == "template":
-        return cmd_template(args)
-    else:
-        parser.print_help()
-        return 1
+    _, _, handler = COMMANDS[args.command]
+    return handler(args)
 
 
 if __name__ == "__main__":
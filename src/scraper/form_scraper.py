@@ -10,30 +10,304 @@ The VIDEX form has 6 main sections/tabs:
 6. Kostenübernahme (Cost Coverage)
 """
 
-import json
+import asyncio
+import os
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 from dataclasses import dataclass, field
-from playwright.sync_api import sync_playwright, Page
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
+from ..automation.browser_options import BROWSER_ARGS
+from ..automation.json_io import dump_json
+
 console = Console()
 
 VIDEX_URL = "https://videx.diplo.de/videx/visum-erfassung/videx-kurzfristiger-aufenthalt"
 
-# Tab names in German (for clicking) and English (for display)
+# Images are not needed for field discovery
+SCRAPER_BROWSER_ARGS = [*BROWSER_ARGS, "--blink-settings=imagesEnabled=false"]
+
+# Tab names in German (for clicking) and English (for display).
+# "anchor" is a selector that becomes visible once the tab has rendered
+# (None: no field that only that tab shows, so the tab waits for the DOM to settle).
+# Travel Data and Reference fields are already visible on the first tab, and the
+# Cost Coverage sponsor fields only appear when an organisation pays, so none of
+# them can signal that their tab has rendered.
 FORM_TABS = [
-    {"de": "Angaben zur Person", "en": "Personal Data", "index": 0},
-    {"de": "Kontaktdaten", "en": "Contact Details", "index": 1},
-    {"de": "Unterlagen", "en": "Documents", "index": 2},
-    {"de": "Reisedaten", "en": "Travel Data", "index": 3},
-    {"de": "Referenz", "en": "Reference", "index": 4},
-    {"de": "Kostenübernahme", "en": "Cost Coverage", "index": 5},
+    {"de": "Angaben zur Person", "en": "Personal Data", "index": 0,
+     "anchor": "[id='antragsteller.familienname']"},
+    {"de": "Kontaktdaten", "en": "Contact Details", "index": 1, "anchor": None},
+    {"de": "Unterlagen", "en": "Documents", "index": 2, "anchor": None},
+    {"de": "Reisedaten", "en": "Travel Data", "index": 3, "anchor": None},
+    {"de": "Referenz", "en": "Reference", "index": 4, "anchor": None},
+    {"de": "Kostenübernahme", "en": "Cost Coverage", "index": 5, "anchor": None},
 ]
 
+# Installed on every page via add_init_script. Finds tabs and the language dropdown
+# in one DOM scan and tags them with data-videx-probe, so each action costs one
+# evaluate plus one click instead of a locator probe per selector. Popup buttons
+# are clicked in place.
+PROBE_SCRIPT = """
+window.__videxProbe = ({tabNames = [], tabIndex = null, popupTexts = [], english = false}) => {
+    const isVisible = el => {
+        const rect = el.getBoundingClientRect();
+        return rect.width > 0 && rect.height > 0;
+    };
+    const textOf = el => (el.textContent || '').trim();
+    const mark = (el, value) => {
+        el.setAttribute('data-videx-probe', value);
+        return '[data-videx-probe="' + value + '"]';
+    };
+    
+    document.querySelectorAll('[data-videx-probe]').forEach(el => el.removeAttribute('data-videx-probe'));
+    const result = {tabSelector: null, popupsClicked: 0, languageSelector: null};
+    
+    // Tab: the smallest visible element containing the tab name
+    for (const name of tabNames) {
+        let best = null;
+        for (const el of document.querySelectorAll('a, div, span, li, button')) {
+            const text = textOf(el);
+            if (text.includes(name) && (!best || text.length < textOf(best).length) && isVisible(el)) {
+                best = el;
+            }
+        }
+        if (best) {
+            result.tabSelector = mark(best, 'tab');
+            break;
+        }
+    }
+    
+    // Fallback: position in the tab bar
+    if (!result.tabSelector && tabIndex !== null) {
+        const bar = document.querySelector("[class*='tab'], [class*='nav'], [role='tablist']");
+        if (bar && isVisible(bar)) {
+            const tabs = bar.querySelectorAll('a, div, span, li, button');
+            if (tabIndex < tabs.length) {
+                result.tabSelector = mark(tabs[tabIndex], 'tab');
+            }
+        }
+    }
+    
+    // Popups: click the first visible button per label, plus any cookie banner button
+    if (popupTexts.length) {
+        const buttons = [...document.querySelectorAll('button')].filter(isVisible);
+        const popups = new Set();
+        for (const label of popupTexts) {
+            const button = buttons.find(b => textOf(b).toLowerCase().includes(label.toLowerCase()));
+            if (button) popups.add(button);
+        }
+        const cookieButton = [...document.querySelectorAll("[class*='cookie'] button")].find(isVisible);
+        if (cookieButton) popups.add(cookieButton);
+        popups.forEach(el => el.click());
+        result.popupsClicked = popups.size;
+    }
+    
+    // Language dropdown offering English
+    if (english) {
+        const select = [...document.querySelectorAll('select')].find(
+            el => isVisible(el) && [...el.options].some(o => o.text.trim() === 'English')
+        );
+        if (select) result.languageSelector = mark(select, 'language');
+    }
+    
+    return result;
+};
+"""
+
+# Injected into every page; returns raw info for all form elements on the current section
+EXTRACT_SCRIPT = """
+window.__videxExtract = () => {
+    const inputs = document.querySelectorAll('input:not([type="hidden"]):not([type="submit"]):not([type="button"])');
+    const selects = document.querySelectorAll('select');
+    const textareas = document.querySelectorAll('textarea');
+    
+    const allElements = [...inputs, ...selects, ...textareas];
+    
+    // Keys already returned by this call, so repeated ids/names are sent once
+    const seen = new Set();
+    
+    // Index label[for] once instead of querying it per element (first label wins)
+    const labelIndex = new Map();
+    for (const labelEl of document.querySelectorAll('label[for]')) {
+        const target = labelEl.getAttribute('for');
+        if (!labelIndex.has(target)) {
+            labelIndex.set(target, labelEl.textContent.trim());
+        }
+    }
+    
+    return allElements.map((el, index) => {
+        // Hidden fields are dropped here so they are never labelled or sent back
+        const rect = el.getBoundingClientRect();
+        if (rect.width === 0 || rect.height === 0) {
+            return null;
+        }
+        
+        const id = el.id || '';
+        const name = el.name || '';
+        
+        const key = id || name;
+        if (key) {
+            if (seen.has(key)) {
+                return null;
+            }
+            seen.add(key);
+        }
+        
+        // Skip language selector
+        if (id === '' && name === '' && el.tagName === 'SELECT') {
+            const firstOption = el.options[0];
+            if (firstOption && (firstOption.text.includes('Deutsch') || firstOption.text.includes('English'))) {
+                return null;
+            }
+        }
+        
+        // Get label - try multiple methods
+        let label = '';
+        
+        // Method 1: label[for]
+        if (id) {
+            label = labelIndex.get(id) || '';
+        }
+        
+        // Method 2: Parent label
+        if (!label) {
+            const parentLabel = el.closest('label');
+            if (parentLabel) {
+                label = parentLabel.textContent.trim();
+            }
+        }
+        
+        // Method 3: Previous sibling
+        if (!label) {
+            let prev = el.previousElementSibling;
+            while (prev && !label) {
+                if (prev.tagName === 'LABEL' || prev.tagName === 'SPAN' || prev.tagName === 'DIV') {
+                    const text = prev.textContent.trim();
+                    if (text && text.length < 200) {
+                        label = text;
+                    }
+                }
+                prev = prev.previousElementSibling;
+            }
+        }
+        
+        // Method 4: Parent's label child
+        if (!label && el.parentElement) {
+            const parentLabel = el.parentElement.querySelector('label');
+            if (parentLabel && parentLabel !== el) {
+                label = parentLabel.textContent.trim();
+            }
+        }
+        
+        // Method 5: Look in parent containers
+        if (!label) {
+            let parent = el.parentElement;
+            for (let i = 0; i < 3 && parent && !label; i++) {
+                const labels = parent.querySelectorAll('label, .label, [class*="label"]');
+                for (const lbl of labels) {
+                    if (!lbl.contains(el)) {
+                        const text = lbl.textContent.trim();
+                        if (text && text.length < 200) {
+                            label = text;
+                            break;
+                        }
+                    }
+                }
+                parent = parent.parentElement;
+            }
+        }
+        
+        // Fallback
+        if (!label) {
+            label = el.placeholder || el.title || name || id || 'Field ' + index;
+        }
+        
+        // Check required - look for * in label or required attribute
+        let required = el.required || el.getAttribute('aria-required') === 'true';
+        if (label.includes('*')) required = true;
+        if ((el.className || '').toLowerCase().includes('required')) required = true;
+        
+        // Get options for select (capture both value and label)
+        let options = [];
+        if (el.tagName === 'SELECT') {
+            options = Array.from(el.options).map(o => ({
+                value: o.value || '',
+                label: o.text.trim()
+            })).filter(o => o.value || o.label);
+        }
+        
+        // Determine field type
+        let fieldType = 'text';
+        if (el.tagName === 'SELECT') fieldType = 'select';
+        else if (el.tagName === 'TEXTAREA') fieldType = 'textarea';
+        else if (el.type === 'checkbox') fieldType = 'checkbox';
+        else if (el.type === 'radio') fieldType = 'radio';
+        else if (el.type === 'date') fieldType = 'date';
+        else if (el.type === 'file') fieldType = 'file';
+        else if (el.type === 'email') fieldType = 'email';
+        else if (el.type === 'tel') fieldType = 'tel';
+        else if (el.type === 'number') fieldType = 'number';
+        
+        // Attribute selector with the value escaped for a double-quoted string
+        const quote = value => '"' + value.replace(/["\\\\]/g, '\\\\$&') + '"';
+        let selector = null;
+        if (id) selector = '[id=' + quote(id) + ']';
+        else if (name) selector = el.tagName.toLowerCase() + '[name=' + quote(name) + ']';
+        
+        // Empty keys are left out; _build_fields falls back to the same defaults
+        const info = {
+            id: id,
+            name: name,
+            label: label.replace(/\\*/g, '').replace(/:/g, '').trim(),
+            fieldType: fieldType,
+            required: required,
+            selector: selector
+        };
+        if (options.length) info.options = options;  // Capture all options
+        if (el.maxLength > 0) info.maxLength = el.maxLength;
+        if (el.placeholder) info.placeholder = el.placeholder;
+        if (el.value && el.type !== 'password') info.value = el.value;
+        return info;
+    }).filter(x => x !== null);
+};
+"""
+
+# Probe arguments per tab: match by English/German name, fall back to tab bar position
+TAB_PROBES = {
+    tab["en"]: {"tabNames": [tab["en"], tab["de"]], "tabIndex": tab["index"]}
+    for tab in FORM_TABS
+}
+
+# Button labels that dismiss popups and cookie banners
+POPUP_TEXTS = ["OK", "Accept", "Close"]
 
-@dataclass
+# Clicks every visible expand/collapse control and returns how many were clicked
+EXPAND_SCRIPT = """() => {
+    const candidates = new Set(document.querySelectorAll(
+        "[class*='collapse'] button, [class*='accordion'] button, [class*='expand'], [aria-expanded='false']"
+    ));
+    for (const button of document.querySelectorAll('button')) {
+        const text = button.textContent || '';
+        if (['+', 'Show', 'Anzeigen'].some(label => text.includes(label))) {
+            candidates.add(button);
+        }
+    }
+    
+    let clicked = 0;
+    for (const el of candidates) {
+        const rect = el.getBoundingClientRect();
+        if (rect.width > 0 && rect.height > 0) {
+            el.click();
+            clicked++;
+        }
+    }
+    return clicked;
+}"""
+
+
+@dataclass(slots=True)
 class FormField:
     """Represents a single form field."""
     id: str
@@ -49,7 +323,7 @@ class FormField:
     default_value: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FormSection:
     """Represents a section/tab of the form."""
     index: int
@@ -58,7 +332,7 @@ class FormSection:
     fields: list[FormField] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class FormSchema:
     """Complete form schema."""
     url: str
@@ -72,308 +346,164 @@ class FormSchema:
 class VidexFormScraper:
     """Scrapes the VIDEX form to extract all field definitions."""
 
-    def __init__(self, headless: bool = False, language: str = "en"):
+    def __init__(
+        self,
+        headless: bool = False,
+        language: str = "en",
+        cdp_endpoint: Optional[str] = None,
+        debug: bool = False
+    ):
         self.headless = headless
         self.language = language
+        self.cdp_endpoint = cdp_endpoint  # Attach to an already running Chromium instead of launching one
+        self.debug = debug  # Save a screenshot of every section
         self.schema = FormSchema(url=VIDEX_URL, language=language)
         self.all_field_ids = set()  # Track all scraped field IDs to avoid duplicates
 
-    def _switch_to_english(self, page: Page) -> bool:
-        """Switch the VIDEX form to English language."""
-        console.print("[cyan]Switching to English language...[/cyan]")
-        
+    async def _probe(self, page: Page, **options) -> dict:
+        """Run the injected DOM probe (see PROBE_SCRIPT) in a single round-trip."""
         try:
-            # The language selector is a dropdown at the top-left
-            lang_selector = page.locator("select").first
-            if lang_selector.is_visible(timeout=3000):
-                # Try to select English
-                try:
-                    lang_selector.select_option(label="English")
-                    console.print("[green]Selected English language[/green]")
-                    page.wait_for_timeout(2000)
-                    page.wait_for_load_state("networkidle", timeout=10000)
-                    return True
-                except Exception:
-                    pass
+            return await page.evaluate("options => window.__videxProbe(options)", options)
         except Exception:
-            pass
-        
-        # Try alternative selectors
-        alt_selectors = [
-            "select:has(option:has-text('English'))",
-            "select:has(option:has-text('Deutsch'))",
-        ]
+            return {"tabSelector": None, "popupsClicked": 0, "languageSelector": None}
+
+    async def _switch_to_english(self, page: Page) -> bool:
+        """Switch the VIDEX form to English language."""
+        console.print("[cyan]Switching to English language...[/cyan]")
         
-        for selector in alt_selectors:
+        language_selector = (await self._probe(page, english=True))["languageSelector"]
+        if language_selector:
             try:
-                element = page.locator(selector).first
-                if element.is_visible(timeout=2000):
-                    element.select_option(label="English")
-                    console.print("[green]Selected English from dropdown[/green]")
-                    page.wait_for_timeout(2000)
-                    page.wait_for_load_state("networkidle", timeout=10000)
-                    return True
+                await page.locator(language_selector).select_option(label="English")
+                console.print("[green]Selected English language[/green]")
+                # The tab bar is relabelled once the English texts are rendered
+                await page.wait_for_selector(f"text={FORM_TABS[0]['en']}", timeout=10000)
+                return True
             except Exception:
-                continue
+                pass
         
         console.print("[yellow]Could not switch to English, continuing with current language[/yellow]")
         return False
 
-    def _click_tab(self, page: Page, tab_info: dict) -> bool:
+    async def _click_tab(self, page: Page, tab_info: dict) -> bool:
         """Click on a specific tab to navigate to that section."""
-        tab_name_de = tab_info["de"]
         tab_name_en = tab_info["en"]
-        tab_index = tab_info["index"]
         
         console.print(f"[cyan]Navigating to tab: {tab_name_en}...[/cyan]")
         
-        # Try various selectors to find and click the tab
-        tab_selectors = [
-            f"text={tab_name_en}",
-            f"text={tab_name_de}",
-            f"a:has-text('{tab_name_en}')",
-            f"a:has-text('{tab_name_de}')",
-            f"div:has-text('{tab_name_en}')",
-            f"div:has-text('{tab_name_de}')",
-            f"span:has-text('{tab_name_en}')",
-            f"span:has-text('{tab_name_de}')",
-            f"li:has-text('{tab_name_en}')",
-            f"li:has-text('{tab_name_de}')",
-            f"button:has-text('{tab_name_en}')",
-            f"button:has-text('{tab_name_de}')",
-        ]
-        
-        for selector in tab_selectors:
+        # Find the tab by English/German name, falling back to its position in the tab bar
+        tab_selector = (await self._probe(page, **TAB_PROBES[tab_name_en]))["tabSelector"]
+        
+        if tab_selector:
             try:
-                tab = page.locator(selector).first
-                if tab.is_visible(timeout=1000):
-                    tab.click()
-                    page.wait_for_timeout(1500)
-                    page.wait_for_load_state("networkidle", timeout=10000)
-                    console.print(f"[green]Clicked tab: {tab_name_en}[/green]")
-                    return True
+                await page.locator(tab_selector).click()
+                console.print(f"[green]Clicked tab: {tab_name_en}[/green]")
             except Exception:
-                continue
+                console.print(f"[yellow]Could not click tab: {tab_name_en}[/yellow]")
+                return False
+            
+            if tab_info["anchor"]:
+                try:
+                    await page.wait_for_selector(tab_info["anchor"], state="visible", timeout=5000)
+                except Exception:
+                    console.print(f"[yellow]{tab_name_en}: expected fields did not appear, extracting anyway[/yellow]")
+            else:
+                await self._wait_for_dom_stable(page)
+            return True
         
-        # Try clicking by index in the tab bar
+        console.print(f"[yellow]Could not click tab: {tab_name_en}[/yellow]")
+        return False
+
+    async def _wait_for_dom_stable(self, page: Page, idle_ms: int = 200, timeout: int = 3000) -> None:
+        """Wait until the number of form controls stops changing for idle_ms."""
         try:
-            tab_bar = page.locator("[class*='tab'], [class*='nav'], [role='tablist']").first
-            if tab_bar.is_visible(timeout=1000):
-                tabs = tab_bar.locator("a, div, span, li, button").all()
-                if tab_index < len(tabs):
-                    tabs[tab_index].click()
-                    page.wait_for_timeout(1500)
-                    console.print(f"[green]Clicked tab by index: {tab_index}[/green]")
-                    return True
+            # Polled inside the page, so the whole wait is one round-trip
+            await page.evaluate("""([idleMs, timeout]) => new Promise(resolve => {
+                const count = () => document.querySelectorAll('input, select, textarea').length;
+                const start = performance.now();
+                let last = count();
+                let stableSince = start;
+                const timer = setInterval(() => {
+                    const now = performance.now();
+                    const current = count();
+                    if (current !== last) {
+                        last = current;
+                        stableSince = now;
+                    }
+                    if (now - stableSince >= idleMs || now - start >= timeout) {
+                        clearInterval(timer);
+                        resolve(current);
+                    }
+                }, 50);
+            })""", [idle_ms, timeout])
         except Exception:
             pass
-        
-        console.print(f"[yellow]Could not click tab: {tab_name_en}[/yellow]")
-        return False
 
-    def _expand_all_sections(self, page: Page) -> None:
+    async def _expand_all_sections(self, page: Page) -> None:
         """Expand any collapsed sections/accordions on the current page."""
-        # Look for expand/collapse buttons or accordions
-        expand_selectors = [
-            "[class*='collapse'] button",
-            "[class*='accordion'] button",
-            "[class*='expand']",
-            "button:has-text('+')",
-            "button:has-text('Show')",
-            "button:has-text('Anzeigen')",
-            "[aria-expanded='false']",
-        ]
-        
-        for selector in expand_selectors:
-            try:
-                buttons = page.locator(selector).all()
-                for button in buttons:
-                    if button.is_visible():
-                        button.click()
-                        page.wait_for_timeout(300)
-            except Exception:
-                continue
+        # Click every visible expand/collapse control in one round-trip
+        try:
+            clicked = await page.evaluate(EXPAND_SCRIPT)
+            if clicked:
+                await page.wait_for_timeout(300)
+        except Exception:
+            pass
 
-    def _scroll_page(self, page: Page) -> None:
+    async def _scroll_page(self, page: Page) -> None:
         """Scroll through the page to ensure all lazy-loaded elements are visible."""
         try:
-            # Scroll to bottom and back
-            page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            page.wait_for_timeout(500)
-            page.evaluate("window.scrollTo(0, 0)")
-            page.wait_for_timeout(500)
+            # Scroll to bottom and back, unless the whole section already fits in the viewport
+            scrolled = await page.evaluate("""() => {
+                if (document.body.scrollHeight <= window.innerHeight) {
+                    return false;
+                }
+                window.scrollTo(0, document.body.scrollHeight);
+                return true;
+            }""")
+            if not scrolled:
+                return
+            await page.wait_for_timeout(500)
+            await page.evaluate("window.scrollTo(0, 0)")
+            await page.wait_for_timeout(500)
         except Exception:
             pass
 
-    def _extract_fields_from_section(self, page: Page, section_name: str) -> list[FormField]:
-        """Extract all form fields from the current section using JavaScript."""
-        fields = []
-        
+    async def _extract_elements(self, page: Page) -> list[dict]:
+        """Extract raw info for all form elements on the current section using JavaScript."""
         # Expand any collapsed sections
-        self._expand_all_sections(page)
+        await self._expand_all_sections(page)
         
         # Scroll to load lazy elements
-        self._scroll_page(page)
+        await self._scroll_page(page)
         
         try:
-            elements = page.evaluate("""() => {
-                const inputs = document.querySelectorAll('input:not([type="hidden"]):not([type="submit"]):not([type="button"])');
-                const selects = document.querySelectorAll('select');
-                const textareas = document.querySelectorAll('textarea');
-                
-                const allElements = [...inputs, ...selects, ...textareas];
-                
-                return allElements.map((el, index) => {
-                    const id = el.id || '';
-                    const name = el.name || '';
-                    
-                    // Skip language selector
-                    if (id === '' && name === '' && el.tagName === 'SELECT') {
-                        const firstOption = el.options[0];
-                        if (firstOption && (firstOption.text.includes('Deutsch') || firstOption.text.includes('English'))) {
-                            return null;
-                        }
-                    }
-                    
-                    // Get label - try multiple methods
-                    let label = '';
-                    
-                    // Method 1: label[for]
-                    if (id) {
-                        try {
-                            const labelEl = document.querySelector('label[for="' + CSS.escape(id) + '"]');
-                            if (labelEl) {
-                                label = labelEl.textContent.trim();
-                            }
-                        } catch(e) {}
-                    }
-                    
-                    // Method 2: Parent label
-                    if (!label) {
-                        const parentLabel = el.closest('label');
-                        if (parentLabel) {
-                            label = parentLabel.textContent.trim();
-                        }
-                    }
-                    
-                    // Method 3: Previous sibling
-                    if (!label) {
-                        let prev = el.previousElementSibling;
-                        while (prev && !label) {
-                            if (prev.tagName === 'LABEL' || prev.tagName === 'SPAN' || prev.tagName === 'DIV') {
-                                const text = prev.textContent.trim();
-                                if (text && text.length < 200) {
-                                    label = text;
-                                }
-                            }
-                            prev = prev.previousElementSibling;
-                        }
-                    }
-                    
-                    // Method 4: Parent's label child
-                    if (!label && el.parentElement) {
-                        const parentLabel = el.parentElement.querySelector('label');
-                        if (parentLabel && parentLabel !== el) {
-                            label = parentLabel.textContent.trim();
-                        }
-                    }
-                    
-                    // Method 5: Look in parent containers
-                    if (!label) {
-                        let parent = el.parentElement;
-                        for (let i = 0; i < 3 && parent && !label; i++) {
-                            const labels = parent.querySelectorAll('label, .label, [class*="label"]');
-                            for (const lbl of labels) {
-                                if (!lbl.contains(el)) {
-                                    const text = lbl.textContent.trim();
-                                    if (text && text.length < 200) {
-                                        label = text;
-                                        break;
-                                    }
-                                }
-                            }
-                            parent = parent.parentElement;
-                        }
-                    }
-                    
-                    // Fallback
-                    if (!label) {
-                        label = el.placeholder || el.title || name || id || 'Field ' + index;
-                    }
-                    
-                    // Check required - look for * in label or required attribute
-                    let required = el.required || el.getAttribute('aria-required') === 'true';
-                    if (label.includes('*')) required = true;
-                    if ((el.className || '').toLowerCase().includes('required')) required = true;
-                    
-                    // Get options for select (capture both value and label)
-                    let options = [];
-                    if (el.tagName === 'SELECT') {
-                        options = Array.from(el.options).map(o => ({
-                            value: o.value || '',
-                            label: o.text.trim()
-                        })).filter(o => o.value || o.label);
-                    }
-                    
-                    // Determine field type
-                    let fieldType = 'text';
-                    if (el.tagName === 'SELECT') fieldType = 'select';
-                    else if (el.tagName === 'TEXTAREA') fieldType = 'textarea';
-                    else if (el.type === 'checkbox') fieldType = 'checkbox';
-                    else if (el.type === 'radio') fieldType = 'radio';
-                    else if (el.type === 'date') fieldType = 'date';
-                    else if (el.type === 'file') fieldType = 'file';
-                    else if (el.type === 'email') fieldType = 'email';
-                    else if (el.type === 'tel') fieldType = 'tel';
-                    else if (el.type === 'number') fieldType = 'number';
-                    
-                    // Check visibility
-                    const rect = el.getBoundingClientRect();
-                    const isVisible = rect.width > 0 && rect.height > 0;
-                    
-                    return {
-                        id: id,
-                        name: name,
-                        label: label.replace(/\\*/g, '').replace(/:/g, '').trim(),
-                        fieldType: fieldType,
-                        required: required,
-                        options: options,  // Capture all options
-                        maxLength: el.maxLength > 0 ? el.maxLength : null,
-                        placeholder: el.placeholder || null,
-                        value: el.value || null,
-                        isVisible: isVisible,
-                        tagName: el.tagName.toLowerCase()
-                    };
-                }).filter(x => x !== null);
-            }""")
+            elements = await page.evaluate("window.__videxExtract()")
         except Exception as e:
             console.print(f"[red]Error extracting elements: {e}[/red]")
             elements = []
         
+        return elements
+
+    def _build_fields(self, elements: list[dict], section_name: str) -> list[FormField]:
+        """Turn extracted (visible) elements into FormFields, skipping already seen fields."""
+        fields = []
+        
         for elem_info in elements:
             try:
-                if not elem_info.get("isVisible", False):
-                    continue
-                
                 elem_id = elem_info.get("id", "")
                 elem_name = elem_info.get("name", "")
                 
                 # Create unique identifier
                 unique_id = elem_id or elem_name or f"field_{len(fields)}"
                 
-                # Skip if already scraped
+                # Skip if an earlier section already has it (tabs are extracted
+                # concurrently, so only duplicates within a section are dropped in JS)
                 if unique_id in self.all_field_ids:
                     continue
                 self.all_field_ids.add(unique_id)
                 
-                # Build selector using attribute format
-                if elem_id:
-                    css_selector = f'[id="{elem_id}"]'
-                elif elem_name:
-                    tag = elem_info.get("tagName", "input")
-                    css_selector = f'{tag}[name="{elem_name}"]'
-                else:
-                    css_selector = f'[id="{unique_id}"]'
+                # Attribute selector built (and escaped) by the extraction script
+                css_selector = elem_info.get("selector") or f'[id="{unique_id}"]'
                 
                 form_field = FormField(
                     id=unique_id,
@@ -397,58 +527,90 @@ class VidexFormScraper:
         
         return fields
 
-    def _handle_popups(self, page: Page) -> None:
+    async def _handle_popups(self, page: Page) -> None:
         """Handle any popups or dialogs."""
-        popup_selectors = [
-            "button:has-text('OK')",
-            "button:has-text('Accept')",
-            "button:has-text('Close')",
-            "[class*='cookie'] button",
-        ]
-        
-        for selector in popup_selectors:
-            try:
-                button = page.locator(selector).first
-                if button.is_visible(timeout=500):
-                    button.click()
-                    page.wait_for_timeout(300)
-            except Exception:
-                continue
+        # The probe finds and clicks the dismiss buttons in one round-trip
+        probe = await self._probe(page, popupTexts=POPUP_TEXTS)
+        
+        if probe["popupsClicked"]:
+            await page.wait_for_timeout(300)
+
+    async def _open_form(self, context: BrowserContext) -> Page:
+        """Open the form in the given context, dismiss popups and switch language."""
+        await context.add_init_script(PROBE_SCRIPT)
+        await context.add_init_script(EXTRACT_SCRIPT)
+        page = await context.new_page()
+        
+        # Handle dialogs automatically
+        page.on("dialog", lambda dialog: dialog.accept())
+        
+        # The Angular app renders the language dropdown once it has booted
+        await page.goto(VIDEX_URL, wait_until="domcontentloaded", timeout=30000)
+        await page.wait_for_selector("select:visible", state="visible", timeout=30000)
+        
+        # Handle any initial popups
+        await self._handle_popups(page)
+        
+        # Switch to English
+        if self.language == "en":
+            await self._switch_to_english(page)
+            await self._handle_popups(page)
+        
+        return page
 
-    def scrape(self) -> FormSchema:
-        """Main scraping method - navigates through all tabs and extracts fields."""
+    async def _scrape_tab(self, browser: Browser, tab_info: dict, screenshots_dir: Optional[Path]) -> list[dict]:
+        """Scrape one tab in its own browser context and return its raw elements."""
+        context = await browser.new_context(
+            viewport={"width": 1920, "height": 1080},
+            locale="en-US"
+        )
+        
+        # The context is closed even if the form never loads, so nothing leaks
+        # into a shared (CDP) browser
+        try:
+            page = await self._open_form(context)
+            
+            if screenshots_dir and tab_info["index"] == 0:
+                await page.screenshot(path=str(screenshots_dir / "scrape_initial.jpg"), type="jpeg", quality=40)
+            
+            # Click the tab
+            await self._click_tab(page, tab_info)
+            
+            # Handle any popups that appear
+            await self._handle_popups(page)
+            
+            elements = await self._extract_elements(page)
+            
+            if screenshots_dir:
+                await page.screenshot(
+                    path=str(screenshots_dir / f"scrape_section_{tab_info['index']}.jpg"),
+                    type="jpeg",
+                    quality=40
+                )
+            
+            return elements
+        finally:
+            await context.close()
+
+    async def scrape_async(self, on_complete: Optional[Callable[[FormSchema], None]] = None) -> FormSchema:
+        """Async variant of scrape() for callers that already run an event loop."""
         console.print("[bold blue]Starting VIDEX form scraping...[/bold blue]")
         console.print(f"[cyan]Form has {len(FORM_TABS)} sections to scrape[/cyan]")
         
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=self.headless)
-            context = browser.new_context(
-                viewport={"width": 1920, "height": 1080},
-                locale="en-US"
-            )
-            page = context.new_page()
-            
-            # Handle dialogs automatically
-            page.on("dialog", lambda dialog: dialog.accept())
+        async with async_playwright() as p:
+            if self.cdp_endpoint:
+                console.print(f"[cyan]Connecting to browser at {self.cdp_endpoint}[/cyan]")
+                browser = await p.chromium.connect_over_cdp(self.cdp_endpoint)
+            else:
+                browser = await p.chromium.launch(headless=self.headless, args=SCRAPER_BROWSER_ARGS)
             
             try:
-                console.print(f"[cyan]Navigating to {VIDEX_URL}[/cyan]")
-                page.goto(VIDEX_URL, wait_until="networkidle", timeout=30000)
-                page.wait_for_timeout(2000)
+                console.print(f"[cyan]Navigating to {VIDEX_URL} ({len(FORM_TABS)} tabs in parallel)[/cyan]")
                 
-                # Handle any initial popups
-                self._handle_popups(page)
-                
-                # Switch to English
-                if self.language == "en":
-                    self._switch_to_english(page)
-                    page.wait_for_timeout(1500)
-                    self._handle_popups(page)
-                
-                # Take screenshot of initial page
-                screenshots_dir = Path(__file__).parent.parent.parent / "screenshots"
-                screenshots_dir.mkdir(exist_ok=True)
-                page.screenshot(path=str(screenshots_dir / "scrape_initial.png"))
+                screenshots_dir = None
+                if self.debug:
+                    screenshots_dir = Path(__file__).parent.parent.parent / "screenshots"
+                    screenshots_dir.mkdir(exist_ok=True)
                 
                 with Progress(
                     SpinnerColumn(),
@@ -457,39 +619,39 @@ class VidexFormScraper:
                 ) as progress:
                     task = progress.add_task("Scraping sections...", total=len(FORM_TABS))
                     
-                    for tab_info in FORM_TABS:
-                        section_name = tab_info["en"]
-                        progress.update(task, description=f"Scraping: {section_name}...")
-                        
-                        # Click the tab
-                        self._click_tab(page, tab_info)
-                        page.wait_for_timeout(1000)
-                        
-                        # Handle any popups that appear
-                        self._handle_popups(page)
-                        
-                        # Extract fields from this section
-                        fields = self._extract_fields_from_section(page, section_name)
-                        
-                        # Create section
-                        section = FormSection(
-                            index=tab_info["index"],
-                            name_de=tab_info["de"],
-                            name_en=section_name,
-                            fields=fields
-                        )
-                        
-                        self.schema.sections.append(section)
-                        console.print(f"[green]{section_name}: Found {len(fields)} fields[/green]")
-                        
-                        # Take screenshot
-                        page.screenshot(path=str(screenshots_dir / f"scrape_section_{tab_info['index']}.png"))
-                        
+                    async def scrape_tab(tab_info: dict) -> list[dict]:
+                        elements = await self._scrape_tab(browser, tab_info, screenshots_dir)
                         progress.advance(task)
+                        return elements
+                    
+                    # Let every tab finish (and close its context) before re-raising the first error
+                    tab_elements = await asyncio.gather(
+                        *(scrape_tab(tab_info) for tab_info in FORM_TABS),
+                        return_exceptions=True
+                    )
+                    for result in tab_elements:
+                        if isinstance(result, BaseException):
+                            raise result
                 
-                # Calculate totals
-                for section in self.schema.sections:
-                    for field in section.fields:
+                # Build sections in tab order so duplicate fields stay with the first tab
+                for i, tab_info in enumerate(FORM_TABS):
+                    section_name = tab_info["en"]
+                    fields = self._build_fields(tab_elements[i], section_name)
+                    tab_elements[i] = None  # Raw elements are no longer needed
+                    
+                    # Create section
+                    section = FormSection(
+                        index=tab_info["index"],
+                        name_de=tab_info["de"],
+                        name_en=section_name,
+                        fields=fields
+                    )
+                    
+                    self.schema.sections.append(section)
+                    console.print(f"[green]{section_name}: Found {len(fields)} fields[/green]")
+                    
+                    # Update totals
+                    for field in fields:
                         self.schema.total_fields += 1
                         if field.required:
                             self.schema.required_fields += 1
@@ -502,35 +664,55 @@ class VidexFormScraper:
                 console.print(f"Required fields: {self.schema.required_fields}")
                 console.print(f"Optional fields: {self.schema.optional_fields}")
                 
+                if on_complete:
+                    on_complete(self.schema)
+                
             except Exception as e:
                 console.print(f"[bold red]Error during scraping: {e}[/bold red]")
-                import traceback
-                traceback.print_exc()
                 raise
             finally:
-                browser.close()
+                # A shared browser stays up; the per-tab contexts are already closed
+                if not self.cdp_endpoint:
+                    await browser.close()
         
         return self.schema
 
+    def scrape(self, on_complete: Optional[Callable[[FormSchema], None]] = None) -> FormSchema:
+        """
+        Main scraping method - navigates through all tabs and extracts fields.
+        
+        Each tab is scraped in its own context of one shared browser, so the
+        page loads and waits of all tabs overlap.
+        
+        Args:
+            on_complete: Called with the finished schema before the browser is
+                closed, so follow-up work can overlap with browser teardown
+        """
+        return asyncio.run(self.scrape_async(on_complete))
+
     def save_schema(self, output_path: Path) -> None:
         """Save the scraped schema to a JSON file."""
-        def serialize(obj):
-            if hasattr(obj, '__dict__'):
-                return {k: serialize(v) for k, v in obj.__dict__.items()}
-            elif isinstance(obj, list):
-                return [serialize(item) for item in obj]
-            else:
-                return obj
-        
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(serialize(self.schema), f, indent=2, ensure_ascii=False)
+        # The encoder walks the dataclasses directly instead of a cloned dict tree.
+        # Write to a .part file first so an interrupted save never leaves a
+        # truncated schema behind.
+        part_path = output_path.with_name(output_path.name + ".part")
+        with open(part_path, 'wb') as f:
+            f.write(dump_json(self.schema))
+        os.replace(part_path, output_path)
         
         console.print(f"[green]Schema saved to {output_path}[/green]")
 
 
-def scrape_videx_form(headless: bool = False, output_path: Optional[Path] = None, language: str = "en") -> FormSchema:
+def scrape_videx_form(
+    headless: bool = False,
+    output_path: Optional[Path] = None,
+    language: str = "en",
+    on_complete: Optional[Callable[[FormSchema], None]] = None,
+    cdp_endpoint: Optional[str] = None,
+    debug: bool = False
+) -> FormSchema:
     """
     Convenience function to scrape the VIDEX form.
     
@@ -538,20 +720,32 @@ def scrape_videx_form(headless: bool = False, output_path: Optional[Path] = None
         headless: Run browser in headless mode
         output_path: Path to save the schema JSON
         language: Language to use (en for English, de for German)
+        on_complete: Called with the schema after it is saved, while the
+            browser is still shutting down
+        cdp_endpoint: CDP URL of a running Chromium to reuse, e.g. a browser
+            started with --remote-debugging-port=9222 and http://localhost:9222
+        debug: Save a screenshot of every section to screenshots/
     
     Returns:
         FormSchema with all extracted fields
     """
-    scraper = VidexFormScraper(headless=headless, language=language)
-    schema = scraper.scrape()
+    scraper = VidexFormScraper(
+        headless=headless,
+        language=language,
+        cdp_endpoint=cdp_endpoint,
+        debug=debug
+    )
     
-    if output_path:
-        scraper.save_schema(output_path)
+    def finish(schema: FormSchema) -> None:
+        if output_path:
+            scraper.save_schema(output_path)
+        if on_complete:
+            on_complete(schema)
     
-    return schema
+    return scraper.scrape(on_complete=finish)
 
 
 if __name__ == "__main__":
-    # Quick test
+    # Quick test; run as a module (python -m src.scraper.form_scraper) for the package imports
     output_dir = Path(__file__).parent.parent.parent / "output"
     schema = scrape_videx_form(headless=False, output_path=output_dir / "fields_schema.json", language="en")
@@ -2,27 +2,159 @@
 Schema Generator - Generates JSON templates and Pydantic models from scraped form data.
 """
 
-import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Optional, TextIO
 from rich.console import Console
 
+from ..automation.json_io import dump_json, load_json
+
 console = Console()
 
+# Generated code files run to hundreds of KB; stream them through a large buffer
+WRITE_BUFFER_SIZE = 256 * 1024
+
+# \W is the complement of str.isalnum() plus "_", matched one character at a time
+_NON_WORD_CHAR_RE = re.compile(r'\W')
+_ALNUM_RUN_RE = re.compile(r'[^\W_]+')
+
+# Characters after the first that may be uppercase: A-Z or anything non-ASCII.
+# The non-ASCII ones are confirmed with str.isupper() in _snake_boundary.
+_SNAKE_CANDIDATE_RE = re.compile(r'(?<!^)[A-Z\x80-\U0010ffff]')
+
+# Characters to escape inside a double-quoted Python string literal
+_ESCAPE_TABLE = str.maketrans({'\\': '\\\\', '"': '\\"', '\n': '\\n'})
+
+# Fixed parts of the generated models.py
+_MODELS_HEADER = (
+    '"""\n'
+    'Auto-generated Pydantic models for VIDEX form validation.\n'
+    'Generated from scraped form schema.\n'
+    '"""\n'
+    '\n'
+    'from typing import Optional, Literal\n'
+    'from pydantic import BaseModel, Field\n'
+    '\n'
+    '\n'
+)
+
+_TYPEDDICT_MODELS_HEADER = (
+    '"""\n'
+    'Auto-generated models for VIDEX form data.\n'
+    'Section models are TypedDicts (no runtime validation); VidexApplication validates.\n'
+    '"""\n'
+    '\n'
+    'from typing import Literal\n'
+    'from typing_extensions import NotRequired, TypedDict\n'
+    'from pydantic import BaseModel\n'
+    '\n'
+    '\n'
+)
+
+# Fixed parts of the generated field_mappings.py
+_FIELD_MAPPINGS_HEADER = (
+    '"""\n'
+    'Auto-generated field mappings for VIDEX form automation.\n'
+    'Maps JSON field keys to CSS selectors.\n'
+    '"""\n'
+    '\n'
+    'from typing import NamedTuple, Optional\n'
+    '\n'
+    '\n'
+    'class FieldMapping(NamedTuple):\n'
+    '    """Represents a field mapping for form automation."""\n'
+    '    field_id: str\n'
+    '    selector: str\n'
+    '    field_type: str\n'
+    '    required: bool\n'
+    '    section: str = ""\n'
+    '    label: str = ""\n'
+    '\n'
+    '\n'
+    '# Field mappings organized by section\n'
+    'FIELD_MAPPINGS: dict[int, list[FieldMapping]] = {\n'
+)
+_FIELD_MAPPINGS_FOOTER = (
+    '}\n'
+    '\n'
+    '\n'
+    '# Flat mapping: field_id -> FieldMapping\n'
+    'FLAT_MAPPINGS: dict[str, FieldMapping] = {\n'
+    '    mapping.field_id: mapping\n'
+    '    for mappings in FIELD_MAPPINGS.values()\n'
+    '    for mapping in mappings\n'
+    '}\n'
+    '\n'
+    '\n'
+    'def get_selector(field_id: str) -> Optional[str]:\n'
+    '    """Get the CSS selector for a field ID."""\n'
+    '    mapping = FLAT_MAPPINGS.get(field_id)\n'
+    '    return mapping.selector if mapping else None\n'
+    '\n'
+    '\n'
+    'def get_required_fields() -> list[str]:\n'
+    '    """Get list of all required field IDs."""\n'
+    '    return [m.field_id for m in FLAT_MAPPINGS.values() if m.required]\n'
+)
+
+# Heading entry written before each section of the flat template
+_SECTION_MARKER_TEMPLATE = "=== %s ==="
+
+# Field types whose template default / model annotation is not "" / str
+_DEFAULT_VALUES = {"checkbox": False, "number": None}
+_PYTHON_TYPES = {"checkbox": "bool", "number": "int"}
+
+# Per-class and per-field code templates, filled with %-formatting
+_MODEL_CLASS_TEMPLATE = 'class %s(BaseModel):\n    """Fields from: %s"""\n\n%s\n\n'
+_MODEL_FIELD_TEMPLATES = {
+    # (required, has Field() arguments) -> template
+    (True, True): '    %s: %s = Field(..., %s)\n',
+    (True, False): '    %s: %s\n',
+    (False, True): '    %s: Optional[%s] = Field(None, %s)\n',
+    (False, False): '    %s: Optional[%s] = None\n',
+}
+_TYPEDDICT_CLASS_TEMPLATE = 'class %s(TypedDict):\n    """Fields from: %s"""\n\n%s\n\n'
+_TYPEDDICT_FIELD_TEMPLATES = {
+    # required -> template
+    True: '    %s: %s\n',
+    False: '    %s: NotRequired[%s]\n',
+}
+_FIELD_MAPPING_TEMPLATE = (
+    '        FieldMapping(\n'
+    '            field_id="%s",\n'
+    '            selector="%s",\n'
+    '            field_type="%s",\n'
+    '            required=%s,\n'
+    '            label="%s",\n'
+    '        ),\n'
+)
+
+
+def load_schema(schema_path: Path) -> dict:
+    """Load and parse a fields_schema.json file."""
+    return load_json(schema_path)
 
-def generate_applicant_template(schema_path: Path, output_path: Path) -> dict:
+
+def generate_applicant_template(
+    schema_path: Path,
+    output_path: Path,
+    schema: Optional[dict] = None
+) -> dict:
     """
     Generate an applicant data template JSON from the scraped schema.
     
     Args:
         schema_path: Path to the fields_schema.json file
         output_path: Path to save the applicant_template.json
+        schema: Already parsed schema (loaded from schema_path if omitted)
     
     Returns:
         The generated template dictionary
     """
-    with open(schema_path, 'r', encoding='utf-8') as f:
-        schema = json.load(f)
+    if schema is None:
+        schema = load_schema(schema_path)
     
     template = {
         "_meta": {
@@ -33,77 +165,66 @@ def generate_applicant_template(schema_path: Path, output_path: Path) -> dict:
         "sections": {}
     }
     
-    # Support both old format (form_pages) and new format (sections)
-    sections = schema.get("sections", schema.get("form_pages", []))
+    sections = _get_sections(schema)
     
+    template_sections = template["sections"]
     for section in sections:
-        section_name = section.get("name_en", section.get("page_title", f"Section {section.get('index', 0)}"))
-        section_key = f"section_{section.get('index', 0)}_{_sanitize_key(section_name)}"
+        section_idx = section.get("index", 0)
+        section_name = section.get("name_en", section.get("page_title", f"Section {section_idx}"))
+        section_key = f"section_{section_idx}_{_sanitize_key(section_name)}"
         
-        template["sections"][section_key] = {
+        template_sections[section_key] = {
             "_section_name": section_name,
-            "fields": {}
-        }
-        
-        for field in section.get("fields", []):
-            field_id = field.get("id", "unknown")
-            field_type = field.get("field_type", "text")
-            required = field.get("required", False)
-            options = field.get("options", [])
-            
-            # Generate appropriate default/placeholder value
-            default_value = _get_default_value(field_type, options)
-            
-            template["sections"][section_key]["fields"][field_id] = {
-                "value": default_value,
-                "label": field.get("label", ""),
-                "type": field_type,
-                "required": required,
-                "options": options if options else None,
-                "max_length": field.get("max_length"),
+            "fields": {
+                field.get("id", "unknown"): _template_field(field)
+                for field in section.get("fields", [])
             }
+        }
     
     # Save template
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(template, f, indent=2, ensure_ascii=False)
+    _write_json(template, output_path)
     
     console.print(f"[green]Applicant template saved to {output_path}[/green]")
     return template
 
 
-def generate_flat_template(schema_path: Path, output_path: Path) -> dict:
+def generate_flat_template(
+    schema_path: Path,
+    output_path: Path,
+    schema: Optional[dict] = None
+) -> dict:
     """
     Generate a flat applicant data template (easier to fill).
     
     Args:
         schema_path: Path to the fields_schema.json file
         output_path: Path to save the flat template
+        schema: Already parsed schema (loaded from schema_path if omitted)
     
     Returns:
         The generated flat template dictionary
     """
-    with open(schema_path, 'r', encoding='utf-8') as f:
-        schema = json.load(f)
+    if schema is None:
+        schema = load_schema(schema_path)
     
     template = {
         "_instructions": "Fill in all fields. Required fields are marked with (REQUIRED)",
     }
     
-    # Support both old format (form_pages) and new format (sections)
-    sections = schema.get("sections", schema.get("form_pages", []))
+    sections = _get_sections(schema)
     
     for section in sections:
         section_name = section.get("name_en", section.get("page_title", ""))
         if section_name:
-            template[f"_section_{section.get('index', 0)}"] = f"=== {section_name} ==="
+            template[f"_section_{section.get('index', 0)}"] = _SECTION_MARKER_TEMPLATE % section_name
         
         for field in section.get("fields", []):
-            field_id = field.get("id", "unknown")
-            field_type = field.get("field_type", "text")
-            required = field.get("required", False)
-            label = field.get("label", field_id)
-            options = field.get("options", [])
+            fget = field.get
+            field_id = fget("id", "unknown")
+            field_type = fget("field_type", "text")
+            required = fget("required", False)
+            label = fget("label", field_id)
+            options = fget("options", [])
             
             # Create descriptive key
             key = field_id
@@ -113,240 +234,204 @@ def generate_flat_template(schema_path: Path, output_path: Path) -> dict:
             required_marker = "(REQUIRED)" if required else "(optional)"
             
             if options:
-                # Handle both old format (list of strings) and new format (list of dicts)
-                option_labels = []
-                for opt in options[:5]:
-                    if isinstance(opt, dict):
-                        option_labels.append(opt.get("label", opt.get("value", "")))
-                    else:
-                        option_labels.append(str(opt))
+                option_labels = _option_labels(options[:5])
                 template[comment_key] = f"{label} {required_marker} - Options: {', '.join(option_labels)}{'...' if len(options) > 5 else ''}"
             else:
                 template[comment_key] = f"{label} {required_marker}"
             
             template[key] = _get_default_value(field_type, options)
     
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(template, f, indent=2, ensure_ascii=False)
+    _write_json(template, output_path)
     
     console.print(f"[green]Flat template saved to {output_path}[/green]")
     return template
 
 
-def generate_pydantic_models(schema_path: Path, output_path: Path) -> str:
+def generate_pydantic_models(
+    schema_path: Path,
+    output_path: Path,
+    schema: Optional[dict] = None,
+    buffer_size: int = WRITE_BUFFER_SIZE,
+    use_typeddict: bool = False
+) -> Path:
     """
     Generate Pydantic model classes from the scraped schema.
     
+    The code is written to the file as it is generated.
+    
     Args:
         schema_path: Path to the fields_schema.json file
         output_path: Path to save the generated Python file
+        schema: Already parsed schema (loaded from schema_path if omitted)
+        buffer_size: Write buffer size for the output file
+        use_typeddict: Emit the section models as TypedDicts (plain dicts at
+            runtime, no per-section validation); field descriptions go to a
+            <SECTION>_DESCRIPTIONS dict next to each class
     
     Returns:
-        The generated Python code as a string
+        Path of the generated Python file
     """
-    with open(schema_path, 'r', encoding='utf-8') as f:
-        schema = json.load(f)
-    
-    code_lines = [
-        '"""',
-        'Auto-generated Pydantic models for VIDEX form validation.',
-        'Generated from scraped form schema.',
-        '"""',
-        '',
-        'from typing import Optional, Literal',
-        'from pydantic import BaseModel, Field',
-        '',
-        '',
-    ]
+    if schema is None:
+        schema = load_schema(schema_path)
     
     # Generate a model for each section/page
     section_models = []
     
-    # Support both old format (form_pages) and new format (sections)
-    sections = schema.get("sections", schema.get("form_pages", []))
+    sections = _get_sections(schema)
     
-    for section in sections:
-        section_idx = section.get("index", section.get("page_number", 0))
-        section_name = section.get("name_en", section.get("page_title", f"Section{section_idx}"))
-        class_name = f"Section{section_idx}{_to_class_name(section_name)}"
-        section_models.append(class_name)
-        
-        code_lines.append(f'class {class_name}(BaseModel):')
-        code_lines.append(f'    """Fields from: {section_name}"""')
-        code_lines.append('')
-        
-        if not section.get("fields"):
-            code_lines.append('    pass')
-            code_lines.append('')
-            code_lines.append('')
-            continue
+    with _open_code_file(output_path, buffer_size) as f:
+        write = f.write
+        write(_TYPEDDICT_MODELS_HEADER if use_typeddict else _MODELS_HEADER)
         
-        for field in section.get("fields", []):
-            field_id = field.get("id", "unknown")
-            field_name = _sanitize_field_name(field_id)
-            field_type = field.get("field_type", "text")
-            required = field.get("required", False)
-            label = field.get("label", "")
-            options = field.get("options", [])
-            max_length = field.get("max_length")
-            
-            # Determine Python type
-            py_type = _get_python_type(field_type, options)
-            
-            # Build Field() arguments
-            field_args = []
-            if label:
-                field_args.append(f'description="{_escape_string(label)}"')
-            if max_length:
-                field_args.append(f'max_length={max_length}')
+        for section in sections:
+            section_idx = section.get("index", section.get("page_number", 0))
+            section_name = section.get("name_en", section.get("page_title", f"Section{section_idx}"))
+            class_name = f"Section{section_idx}{_to_class_name(section_name)}"
+            section_models.append(class_name)
             
-            # Generate field definition
-            if required:
-                if field_args:
-                    code_lines.append(f'    {field_name}: {py_type} = Field(..., {", ".join(field_args)})')
-                else:
-                    code_lines.append(f'    {field_name}: {py_type}')
-            else:
-                if field_args:
-                    code_lines.append(f'    {field_name}: Optional[{py_type}] = Field(None, {", ".join(field_args)})')
-                else:
-                    code_lines.append(f'    {field_name}: Optional[{py_type}] = None')
+            # Each class is rendered and written in one piece
+            if use_typeddict:
+                write(_typeddict_class(class_name, section_name, section.get("fields", [])))
+                continue
+            body = ''.join(map(_model_field_line, section.get("fields", []))) or '    pass\n'
+            write(_MODEL_CLASS_TEMPLATE % (class_name, section_name, body))
         
-        code_lines.append('')
-        code_lines.append('')
-    
-    # Generate main application model
-    code_lines.append('class VidexApplication(BaseModel):')
-    code_lines.append('    """Complete VIDEX visa application data."""')
-    code_lines.append('')
-    
-    for model_name in section_models:
-        attr_name = _to_snake_case(model_name)
-        code_lines.append(f'    {attr_name}: {model_name}')
-    
-    code_lines.append('')
-    
-    # Write to file
-    code = '\n'.join(code_lines)
-    
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(code)
+        # Generate main application model
+        write('class VidexApplication(BaseModel):\n')
+        write('    """Complete VIDEX visa application data."""\n\n')
+        
+        for model_name in section_models:
+            write(f'    {_to_snake_case(model_name)}: {model_name}\n')
     
     console.print(f"[green]Pydantic models saved to {output_path}[/green]")
-    return code
+    return output_path
 
 
-def generate_field_mappings(schema_path: Path, output_path: Path) -> str:
+def generate_field_mappings(
+    schema_path: Path,
+    output_path: Path,
+    schema: Optional[dict] = None,
+    buffer_size: int = WRITE_BUFFER_SIZE
+) -> Path:
     """
     Generate field mappings Python file from the scraped schema.
     
+    The code is written to the file as it is generated.
+    
     Args:
         schema_path: Path to the fields_schema.json file
         output_path: Path to save the generated Python file
+        schema: Already parsed schema (loaded from schema_path if omitted)
+        buffer_size: Write buffer size for the output file
     
     Returns:
-        The generated Python code as a string
+        Path of the generated Python file
     """
-    with open(schema_path, 'r', encoding='utf-8') as f:
-        schema = json.load(f)
-    
-    code_lines = [
-        '"""',
-        'Auto-generated field mappings for VIDEX form automation.',
-        'Maps JSON field keys to CSS selectors.',
-        '"""',
-        '',
-        'from dataclasses import dataclass',
-        'from typing import Optional',
-        '',
-        '',
-        '@dataclass',
-        'class FieldMapping:',
-        '    """Represents a field mapping for form automation."""',
-        '    field_id: str',
-        '    selector: str',
-        '    field_type: str',
-        '    required: bool',
-        '    section: str = ""',
-        '    label: str = ""',
-        '',
-        '',
-        '# Field mappings organized by section',
-        'FIELD_MAPPINGS: dict[int, list[FieldMapping]] = {',
-    ]
+    if schema is None:
+        schema = load_schema(schema_path)
     
-    # Support both old format (form_pages) and new format (sections)
-    sections = schema.get("sections", schema.get("form_pages", []))
+    sections = _get_sections(schema)
     
-    for section in sections:
-        section_idx = section.get("index", section.get("page_number", 0))
-        section_name = section.get("name_en", section.get("page_title", ""))
-        
-        code_lines.append(f'    # Section {section_idx}: {section_name}')
-        code_lines.append(f'    {section_idx}: [')
+    with _open_code_file(output_path, buffer_size) as f:
+        write = f.write
+        write(_FIELD_MAPPINGS_HEADER)
         
-        for field in section.get("fields", []):
-            field_id = field.get("id", "unknown")
-            selector = field.get("selector", "")
-            field_type = field.get("field_type", "text")
-            required = field.get("required", False)
-            label = _escape_string(field.get("label", ""))
+        for section in sections:
+            section_idx = section.get("index", section.get("page_number", 0))
+            section_name = section.get("name_en", section.get("page_title", ""))
+            
+            write(f'    # Section {section_idx}: {section_name}\n')
+            write(f'    {section_idx}: [\n')
             
-            code_lines.append(f'        FieldMapping(')
-            code_lines.append(f'            field_id="{field_id}",')
-            code_lines.append(f'            selector="{selector}",')
-            code_lines.append(f'            field_type="{field_type}",')
-            code_lines.append(f'            required={required},')
-            code_lines.append(f'            label="{label}",')
-            code_lines.append(f'        ),')
+            for field in section.get("fields", []):
+                fget = field.get
+                # Selectors are attribute selectors like [id="..."], so every
+                # string value is escaped for the double-quoted literal
+                write(_FIELD_MAPPING_TEMPLATE % (
+                    _escape_string(fget("id", "unknown")),
+                    _escape_string(fget("selector", "")),
+                    _escape_string(fget("field_type", "text")),
+                    fget("required", False),
+                    _escape_string(fget("label", ""))
+                ))
+            
+            write('    ],\n')
         
-        code_lines.append('    ],')
-    
-    code_lines.append('}')
-    code_lines.append('')
-    code_lines.append('')
-    code_lines.append('# Flat mapping: field_id -> FieldMapping')
-    code_lines.append('FLAT_MAPPINGS: dict[str, FieldMapping] = {')
-    code_lines.append('    mapping.field_id: mapping')
-    code_lines.append('    for mappings in FIELD_MAPPINGS.values()')
-    code_lines.append('    for mapping in mappings')
-    code_lines.append('}')
-    code_lines.append('')
-    code_lines.append('')
-    code_lines.append('def get_selector(field_id: str) -> Optional[str]:')
-    code_lines.append('    """Get the CSS selector for a field ID."""')
-    code_lines.append('    mapping = FLAT_MAPPINGS.get(field_id)')
-    code_lines.append('    return mapping.selector if mapping else None')
-    code_lines.append('')
-    code_lines.append('')
-    code_lines.append('def get_required_fields() -> list[str]:')
-    code_lines.append('    """Get list of all required field IDs."""')
-    code_lines.append('    return [m.field_id for m in FLAT_MAPPINGS.values() if m.required]')
-    code_lines.append('')
-    
-    code = '\n'.join(code_lines)
-    
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(code)
+        write(_FIELD_MAPPINGS_FOOTER)
     
     console.print(f"[green]Field mappings saved to {output_path}[/green]")
-    return code
+    return output_path
+
+
+def generate_all(
+    schema_path: Path,
+    template_dir: Path,
+    code_dir: Path,
+    use_typeddict: bool = False
+) -> None:
+    """
+    Generate both templates and both code files from one schema.
+    
+    The schema is parsed once and the four independent generators run
+    concurrently.
+    
+    Args:
+        schema_path: Path to the fields_schema.json file
+        template_dir: Directory for applicant_template.json and applicant_flat.json
+        code_dir: Directory for models.py and field_mappings.py
+        use_typeddict: Generate the section models as TypedDicts
+    """
+    schema = load_schema(schema_path)
+    
+    jobs = [
+        (generate_applicant_template, template_dir / "applicant_template.json", {}),
+        (generate_flat_template, template_dir / "applicant_flat.json", {}),
+        (generate_pydantic_models, code_dir / "models.py", {"use_typeddict": use_typeddict}),
+        (generate_field_mappings, code_dir / "field_mappings.py", {}),
+    ]
+    
+    with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+        futures = [
+            executor.submit(generate, schema_path, output_path, schema, **options)
+            for generate, output_path, options in jobs
+        ]
+    
+    # Re-raise the first failure, if any
+    for future in futures:
+        future.result()
 
 
 # Helper functions
 
+def _get_sections(schema: dict) -> list:
+    """Sections of a schema; schemas from older scrapes call them form_pages."""
+    if "sections" in schema:
+        return schema["sections"]
+    return schema.get("form_pages", [])
+
+
+def _write_json(data: Any, output_path: Path) -> None:
+    """Write data as indented UTF-8 JSON in a single write."""
+    content = dump_json(data)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_bytes(content)
+
+
+def _open_code_file(output_path: Path, buffer_size: int = WRITE_BUFFER_SIZE) -> TextIO:
+    """Open a generated code file for buffered UTF-8 writing ("\\n" line endings)."""
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    return open(output_path, 'w', encoding='utf-8', buffering=buffer_size, newline='\n')
+
+
 def _sanitize_key(text: str) -> str:
     """Convert text to a valid JSON key."""
-    return ''.join(c if c.isalnum() else '_' for c in text.lower()).strip('_')
+    return _NON_WORD_CHAR_RE.sub('_', text.lower()).strip('_')
 
 
 def _sanitize_field_name(text: str) -> str:
     """Convert text to a valid Python identifier."""
     # Handle empty or numeric-starting names
-    name = ''.join(c if c.isalnum() or c == '_' else '_' for c in text)
+    name = _NON_WORD_CHAR_RE.sub('_', text)
     if name and name[0].isdigit():
         name = 'field_' + name
     return name or 'unknown_field'
@@ -354,70 +439,120 @@ def _sanitize_field_name(text: str) -> str:
 
 def _to_class_name(text: str) -> str:
     """Convert text to a valid Python class name."""
-    words = ''.join(c if c.isalnum() else ' ' for c in text).split()
+    words = _ALNUM_RUN_RE.findall(text)
     return ''.join(word.capitalize() for word in words)
 
 
+def _snake_boundary(match: re.Match) -> str:
+    """Prefix an uppercase character with an underscore."""
+    char = match.group()
+    return '_' + char if char.isupper() else char
+
+
 def _to_snake_case(text: str) -> str:
     """Convert CamelCase to snake_case."""
-    result = []
-    for i, char in enumerate(text):
-        if char.isupper() and i > 0:
-            result.append('_')
-        result.append(char.lower())
-    return ''.join(result)
+    return _SNAKE_CANDIDATE_RE.sub(_snake_boundary, text).lower()
 
 
 def _escape_string(text: str) -> str:
     """Escape string for use in Python code."""
-    return text.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+    return text.translate(_ESCAPE_TABLE)
+
+
+def _model_field_line(field: dict) -> str:
+    """Render the Pydantic field definition line for one schema field."""
+    fget = field.get
+    field_name = _sanitize_field_name(fget("id", "unknown"))
+    label = fget("label", "")
+    max_length = fget("max_length")
+    
+    # Determine Python type
+    py_type = _get_python_type(fget("field_type", "text"), fget("options", []))
+    
+    # Build Field() arguments
+    field_args = []
+    if label:
+        field_args.append(f'description="{_escape_string(label)}"')
+    if max_length:
+        field_args.append(f'max_length={max_length}')
+    
+    template = _MODEL_FIELD_TEMPLATES[bool(fget("required", False)), bool(field_args)]
+    if field_args:
+        return template % (field_name, py_type, ", ".join(field_args))
+    return template % (field_name, py_type)
+
+
+def _typeddict_class(class_name: str, section_name: str, fields: list) -> str:
+    """Render a section TypedDict plus the dict holding its field descriptions."""
+    lines = []
+    descriptions = []
+    for field in fields:
+        fget = field.get
+        field_name = _sanitize_field_name(fget("id", "unknown"))
+        py_type = _get_python_type(fget("field_type", "text"), fget("options", []))
+        lines.append(_TYPEDDICT_FIELD_TEMPLATES[bool(fget("required", False))] % (field_name, py_type))
+        
+        label = fget("label", "")
+        if label:
+            descriptions.append(f'    "{field_name}": "{_escape_string(label)}",\n')
+    
+    code = _TYPEDDICT_CLASS_TEMPLATE % (class_name, section_name, ''.join(lines) or '    pass\n')
+    if descriptions:
+        code += f'{_to_snake_case(class_name).upper()}_DESCRIPTIONS: dict[str, str] = {{\n{"".join(descriptions)}}}\n\n\n'
+    return code
+
+
+def _template_field(field: dict) -> dict:
+    """Build the applicant_template.json entry for one schema field."""
+    fget = field.get
+    field_type = fget("field_type", "text")
+    options = fget("options", [])
+    return {
+        "value": _get_default_value(field_type, options),
+        "label": fget("label", ""),
+        "type": field_type,
+        "required": fget("required", False),
+        "options": options if options else None,
+        "max_length": fget("max_length"),
+    }
 
 
 def _get_default_value(field_type: str, options: list) -> Any:
     """Get an appropriate default value for a field type."""
-    if field_type == "checkbox":
-        return False
-    elif field_type == "select" and options:
-        return ""  # Empty, user should select from options
-    elif field_type == "date":
-        return ""  # Format: YYYY-MM-DD
-    elif field_type == "number":
-        return None
-    else:
-        return ""
+    # Selects and dates start empty too: the user picks an option / enters YYYY-MM-DD
+    return _DEFAULT_VALUES.get(field_type, "")
 
 
 def _get_python_type(field_type: str, options: list) -> str:
     """Get the Python type annotation for a field type."""
-    if field_type == "checkbox":
-        return "bool"
-    elif field_type == "number":
-        return "int"
-    elif field_type == "select" and options and len(options) <= 10:
+    if field_type == "select" and options and len(options) <= 10:
         # Use Literal for small option sets
-        # Handle both old format (strings) and new format (dicts)
-        escaped_options = []
-        for opt in options:
-            if isinstance(opt, dict):
-                label = opt.get("label", opt.get("value", ""))
-            else:
-                label = str(opt)
-            escaped_options.append(f'"{_escape_string(label)}"')
-        return f"Literal[{', '.join(escaped_options)}]"
-    else:
-        return "str"
+        return _literal_type(tuple(_option_labels(options)))
+    return _PYTHON_TYPES.get(field_type, "str")
+
+
+def _option_labels(options: list) -> list[str]:
+    """Display labels of select options, old format (strings) or new format (dicts)."""
+    return [
+        opt.get("label", opt.get("value", "")) if isinstance(opt, dict) else str(opt)
+        for opt in options
+    ]
+
+
+@lru_cache(maxsize=256)
+def _literal_type(labels: tuple[str, ...]) -> str:
+    """Build a Literal[...] annotation; option sets repeat across fields."""
+    escaped_options = ', '.join(f'"{_escape_string(label)}"' for label in labels)
+    return f"Literal[{escaped_options}]"
 
 
 if __name__ == "__main__":
-    # Test generation
+    # Test generation; run as a module (python -m src.scraper.schema_generator) for the package imports
     base_path = Path(__file__).parent.parent.parent
     schema_path = base_path / "output" / "fields_schema.json"
     
     if schema_path.exists():
-        generate_applicant_template(schema_path, base_path / "output" / "applicant_template.json")
-        generate_flat_template(schema_path, base_path / "output" / "applicant_flat.json")
-        generate_pydantic_models(schema_path, base_path / "src" / "automation" / "models.py")
-        generate_field_mappings(schema_path, base_path / "src" / "automation" / "field_mappings.py")
+        generate_all(schema_path, base_path / "output", base_path / "src" / "automation")
     else:
         console.print("[red]Schema file not found. Run the scraper first.[/red]")
 